@@ -158,7 +158,16 @@ class MatplotlibAxes:
         artist_spec = event.artist_spec
         artist = self._artists[artist_spec.uuid]
         artist.set(**event.update)
-        self._update_and_draw()
+        # Restyling many artists in a row (e.g. changing the colormap of every
+        # image) should not rebuild the legend and limits once per artist.
+        # Only lines appear in the legend, and only an image's extent moves
+        # the data limits. draw_idle() coalesces, so the canvas redraws once.
+        if isinstance(artist_spec, Line):
+            self.axes.legend(loc=1)
+        if "extent" in event.update:
+            self.axes.relim()
+            self.axes.autoscale_view()
+        self.draw_idle()
 
     def _on_artist_spec_removed(self, event):
         artist_spec = event.item
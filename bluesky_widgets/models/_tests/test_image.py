@@ -48,3 +48,23 @@ def test_figure_set_after_instantiation(FigureView):
     assert model.figure is figure
     view = FigureView(model.figure)
     view.close()
+
+
+def test_image_reduction_takes_middle_slice():
+    "Higher-dimensional arrays are reduced to the middle 2D slice."
+    data = numpy.random.random((5, 7, 11, 13))
+    run = build_simple_run({"ccd": data})
+    model = Images("ccd")
+    model.add_run(run)
+    actual = model.figure.axes[0].artists[0].update()["array"]
+    assert numpy.array_equal(actual, data[2, 3])
+
+
+def test_image_array_is_materialized():
+    "The lazy, reduced array is read into memory once, in the transform."
+    run = build_simple_run({"ccd": numpy.random.random((5, 7, 11))})
+    model = Images("ccd")
+    model.add_run(run)
+    actual = model.figure.axes[0].artists[0].update()["array"]
+    assert type(actual) is numpy.ndarray
+    assert actual.shape == (7, 11)
@@ -1,4 +1,4 @@
-from bluesky_live.run_builder import build_simple_run
+from bluesky_live.run_builder import build_simple_run, RunBuilder
 import pytest
 
 from ..plot_builders import Lines
@@ -33,6 +33,7 @@ def test_pinned(FigureView):
     pinned_run = runs[5]
     model.add_run(pinned_run, pinned=True)
     assert frozenset([pinned_run.metadata["start"]["uid"]]) == model.pinned
+    assert isinstance(model.pinned, frozenset)
     for run in runs[6:]:
         model.add_run(run)
         assert len(model.runs) == 1 + MAX_RUNS
@@ -257,3 +258,136 @@ def test_title(test_titles, expected_titles, FigureView):
     assert view.figure.axes[0].get_title() == expected_titles[3]
 
     view.close()
+
+
+def test_transform_cached_for_completed_run():
+    "A completed run is evaluated once, however often its line is redrawn."
+    calls = []
+
+    def y(det):
+        calls.append(det)
+        return det
+
+    model = Lines("motor", [y])
+    model.add_run(runs[0])
+    (line,) = model.axes.artists
+    first = line.update()
+    second = line.update()
+    assert len(calls) == 1
+    assert first is not second
+    assert list(first["y"]) == list(second["y"]) == [10, 20]
+
+
+def test_culling_order_with_pinned_and_discarded_runs():
+    "The oldest unpinned run is bumped, however many pinned runs precede it."
+    model = Lines("motor", ["det"], max_runs=2)
+    model.add_run(runs[0], pinned=True)
+    model.add_run(runs[1], pinned=True)
+    model.add_run(runs[2])
+    model.add_run(runs[3])
+    model.add_run(runs[4])
+    assert list(model.runs) == [runs[0], runs[1], runs[3], runs[4]]
+
+    # A run discarded by the user is not bumped again later.
+    model.discard_run(runs[3])
+    model.add_run(runs[5])
+    assert list(model.runs) == [runs[0], runs[1], runs[4], runs[5]]
+    model.add_run(runs[6])
+    assert list(model.runs) == [runs[0], runs[1], runs[5], runs[6]]
+    assert len(model.axes.artists) == 4
+
+
+def test_cull_run_that_never_became_ready():
+    "A run culled before its stream arrives has no artists and is forgotten."
+    builder = RunBuilder()
+    live_run = builder.get_run()
+    model = Lines("motor", ["det"], max_runs=1)
+    model.add_run(live_run)
+    assert not model.axes.artists
+    model.add_run(runs[0])
+    assert list(model.runs) == [runs[0]]
+    # The stream arriving late does not resurrect the removed run's lines.
+    builder.add_stream("primary", data={"motor": [1, 2], "det": [10, 20]})
+    assert len(model.axes.artists) == 1
+    builder.close()
+
+
+def test_default_label():
+    "Lines are labeled by scan_id and y by default."
+    model = Lines("motor", ["det", lambda det2: det2])
+    model.add_run(runs[0])
+    labels = [artist.label for artist in model.axes.artists]
+    assert labels == ["Scan 1 det", "Scan 1 <lambda>"]
+
+
+def test_color_cycle():
+    "Lines cycle through ten colors, and the cycle can be restarted."
+    model = Lines("motor", ["det"], max_runs=12)
+    for run in runs:
+        model.add_run(run)
+    colors = [artist.style["color"] for artist in model.axes.artists]
+    assert colors == [f"C{i}" for i in range(10)]
+    model.reset_colors()
+    model.add_run(build_simple_run({"motor": [1, 2], "det": [10, 20]}))
+    assert model.axes.artists[-1].style["color"] == "C0"
+
+
+def test_transform_cached_for_live_run_until_new_data():
+    "A live run is re-evaluated only when the streams it needs get new data."
+    calls = []
+
+    def y(det):
+        calls.append(det)
+        return det
+
+    builder = RunBuilder()
+    builder.add_stream("primary", data={"motor": [1], "det": [10]})
+    builder.add_stream("baseline", data={"temperature": [300]})
+    model = Lines("motor", [y])
+    model.add_run(builder.get_run())
+    (line,) = model.axes.artists
+    line.update()
+    line.update()
+    assert len(calls) == 1
+
+    # New data in another stream does not trigger re-evaluation.
+    builder.add_data("baseline", data={"temperature": [301]})
+    line.update()
+    assert len(calls) == 1
+
+    builder.add_data("primary", data={"motor": [2], "det": [20]})
+    assert list(line.update()["y"]) == [10, 20]
+    assert len(calls) == 2
+
+    # Once completed, the final result is computed once more and then reused.
+    builder.close()
+    line.update()
+    line.update()
+    assert len(calls) == 3
+
+
+def test_transform_cache_invalidated_before_redraw():
+    "A redraw triggered by new data sees the new data, not the cached result."
+    builder = RunBuilder()
+    builder.add_stream("primary", data={"motor": [1], "det": [10]})
+    model = Lines("motor", ["det"])
+    model.add_run(builder.get_run())
+    (line,) = model.axes.artists
+    line.update()  # The transform subscribes to new data after the artist did.
+
+    redrawn = []
+    line.events.new_data.connect(lambda event: redrawn.append(list(line.update()["y"])))
+    builder.add_data("primary", data={"motor": [2], "det": [20]})
+    assert redrawn == [[10, 20]]
+    builder.close()
+
+
+def test_live_lines_restyled_when_complete():
+    "Every line of a live run gets its own color when the run completes."
+    builder = RunBuilder()
+    builder.add_stream("primary", data={"motor": [1], "det": [10], "det2": [15]})
+    model = Lines("motor", ["det", "det2"])
+    model.add_run(builder.get_run())
+    assert [line.style["color"] for line in model.axes.artists] == ["black", "black"]
+    builder.close()
+    assert {line.style["color"] for line in model.axes.artists} == {"C0", "C1"}
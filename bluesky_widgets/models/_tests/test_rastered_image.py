@@ -2,7 +2,7 @@ from bluesky_live.run_builder import RunBuilder
 import pytest
 import numpy
 
-from ..plot_builders import RasteredImages
+from ..plot_builders import RasteredImages, _snake_fill_loop, _snake_fill_numpy
 from ..plot_specs import Axes, Figure
 
 
@@ -184,3 +184,106 @@ def test_figure_set_after_instantiation():
     assert model.figure is None
     figure = Figure((axes,), title="")
     assert model.figure is figure
+
+
+def test_snaking_image_data_non_square(FigureView):
+    "Test a partially-filled, non-square snaking raster."
+    md = {"motors": ["y", "x"], "shape": [3, 4], "snaking": (False, True)}
+    with RunBuilder(md) as builder:
+        builder.add_stream(
+            "primary",
+            data={
+                "ccd": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+                "x": [0, 1, 2, 3, 3, 2, 1, 0, 0, 1],
+                "y": [0, 0, 0, 0, 1, 1, 1, 1, 2, 2],
+            },
+        )
+    run = builder.get_run()
+    model = RasteredImages("ccd", shape=(3, 4))
+    view = FigureView(model.figure)
+    model.add_run(run)
+    actual_data = model.figure.axes[0].artists[0].update()["array"]
+    expected_data = [
+        [1, 2, 3, 4],
+        [8, 7, 6, 5],
+        [9, 10, numpy.nan, numpy.nan],
+    ]
+    assert numpy.array_equal(actual_data, expected_data, equal_nan=True)
+    view.close()
+
+
+@pytest.mark.parametrize("snaking", [(False, False), (False, True)])
+def test_too_many_points(snaking):
+    "A run with more points than the raster holds raises instead of overflowing."
+    md = {"motors": ["y", "x"], "shape": [2, 2], "snaking": snaking}
+    with RunBuilder(md) as builder:
+        builder.add_stream(
+            "primary",
+            data={
+                "ccd": [1, 2, 3, 4, 5, 6, 7],
+                "x": [0, 1, 0, 1, 0, 1, 0],
+                "y": [0, 0, 1, 1, 2, 2, 3],
+            },
+        )
+    run = builder.get_run()
+    model = RasteredImages("ccd", shape=(2, 2))
+    with pytest.raises(ValueError, match="do not fit in the raster"):
+        model._transform(run, "ccd")
+
+
+@pytest.mark.parametrize("snaking_col", [False, True])
+@pytest.mark.parametrize("n_points", [0, 1, 5, 7, 12])
+def test_snake_fill_implementations_agree(snaking_col, n_points):
+    "The numba kernel and the vectorized numpy fallback give the same result."
+    data = numpy.arange(n_points, dtype=float)
+    expected = numpy.full((3, 4), numpy.nan)
+    _snake_fill_numpy(expected, data, snaking_col)
+    actual = numpy.full((3, 4), numpy.nan)
+    _snake_fill_loop(actual, data, snaking_col)
+    assert numpy.array_equal(actual, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "input_dtype, expected_dtype",
+    [
+        ("float32", "float32"),
+        ("float64", "float64"),
+        ("uint8", "float32"),
+        ("uint16", "float32"),
+        ("int32", "float64"),
+        ("int64", "float64"),
+    ],
+)
+def test_image_data_dtype(input_dtype, expected_dtype):
+    "The image is the narrowest floating dtype that holds the data exactly."
+    md = {"motors": ["y", "x"], "shape": [2, 2], "snaking": (False, False)}
+    with RunBuilder(md) as builder:
+        builder.add_stream(
+            "primary",
+            data={
+                "ccd": numpy.array([1, 2, 3], dtype=input_dtype),
+                "x": [0, 1, 0],
+                "y": [0, 0, 1],
+            },
+        )
+    run = builder.get_run()
+    model = RasteredImages("ccd", shape=(2, 2))
+    model.add_run(run)
+    actual_data = model.figure.axes[0].artists[0].update()["array"]
+    assert actual_data.dtype == numpy.dtype(expected_dtype)
+    assert numpy.array_equal(actual_data, [[1, 2], [3, numpy.nan]], equal_nan=True)
+
+
+def test_style_setters(non_snaking_run, FigureView):
+    "Setting cmap, clim, or extent restyles the image."
+    model = RasteredImages("ccd", shape=(2, 2))
+    view = FigureView(model.figure)
+    model.add_run(non_snaking_run)
+    (image,) = model.figure.axes[0].artists
+    model.cmap = "magma"
+    model.clim = (1, 3)
+    model.extent = (-1, 1, -1, 1)
+    assert image.style["cmap"] == "magma"
+    assert image.style["clim"] == (1, 3)
+    assert image.style["extent"] == (-1, 1, -1, 1)
+    view.close()
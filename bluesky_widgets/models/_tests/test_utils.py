@@ -1,9 +1,12 @@
+import collections
+
 from bluesky_live.run_builder import build_simple_run, RunBuilder
 import numpy
 import xarray
 import pytest
 
-from ..utils import call_or_eval, construct_namespace
+from .. import utils
+from ..utils import _compile_expression, call_or_eval, construct_namespace
 
 
 def test_namespace():
@@ -93,6 +96,89 @@ def test_call_or_eval_errors():
         call_or_eval({"x": "missing_key"}, run, ["primary"])
 
 
+def test_call_or_eval_reuses_compiled_expression():
+    "Evaluating the same expression twice should only compile it once."
+    run = build_simple_run({"motor": [1, 2], "det": [10, 20]})
+    expression = "det / motor + 0"  # unlikely to be cached by another test
+    call_or_eval({"x": expression}, run, ["primary"])
+    misses = _compile_expression.cache_info().misses
+    result = call_or_eval({"x": expression}, run, ["primary"])
+    assert _compile_expression.cache_info().misses == misses
+    assert numpy.array_equal(result["x"], [10, 10])
+
+
+@pytest.mark.skipif(utils.numexpr is None, reason="requires numexpr")
+def test_call_or_eval_large_arrays():
+    "Long columns are evaluated with numexpr, falling back to eval if needed."
+    n = 2 * utils._NUMEXPR_MIN_SIZE
+    I0 = numpy.linspace(1, 2, n)
+    It = numpy.linspace(3, 4, n)
+    run = build_simple_run({"I0": I0, "It": It})
+    result = call_or_eval({"x": "5 * log(I0/It)"}, run, ["primary"])
+    assert numpy.allclose(result["x"], 5 * numpy.log(I0 / It))
+    # numexpr does not support indexing, so this uses eval.
+    result = call_or_eval({"x": "I0[::10] + It[::10]"}, run, ["primary"])
+    assert numpy.allclose(result["x"], I0[::10] + It[::10])
+    assert any(key[0] == "I0[::10] + It[::10]" for key in utils._numexpr_unsupported)
+
+
+@pytest.mark.skipif(utils.numexpr is None, reason="requires numexpr")
+@pytest.mark.parametrize("n", [10, 2 * utils._NUMEXPR_MIN_SIZE])
+def test_call_or_eval_result_type_does_not_depend_on_length(n):
+    "An expression gives a DataArray whether or not numexpr evaluates it."
+    I0 = numpy.linspace(1, 2, n)
+    It = numpy.linspace(3, 4, n)
+    run = build_simple_run({"I0": I0, "It": It})
+    result = call_or_eval({"x": "5 * log(I0/It)"}, run, ["primary"])
+    expected = 5 * numpy.log(run.primary.read()["I0"] / run.primary.read()["It"])
+    assert isinstance(result["x"], xarray.DataArray)
+    xarray.testing.assert_allclose(result["x"], expected)
+
+
+@pytest.mark.skipif(utils.numexpr is None, reason="requires numexpr")
+def test_numexpr_failure_is_specific_to_input_types():
+    "A failure with one kind of input does not disable numexpr for others."
+    n = 2 * utils._NUMEXPR_MIN_SIZE
+    expression = "a < b"
+    code = compile(expression, "<expression>", "eval")
+    a = numpy.linspace(1, 2, n)
+    # numexpr cannot compare with a complex number, so this fails and is cached.
+    assert utils._evaluate_with_numexpr(expression, code, {"a": a, "b": 1j}) is None
+    result = utils._evaluate_with_numexpr(expression, code, {"a": a, "b": 1.5})
+    assert numpy.array_equal(result, a < 1.5)
+    # Integer arrays are left to eval, which promotes types like numpy does.
+    ints = numpy.arange(n, dtype="int32")
+    assert utils._evaluate_with_numexpr(expression, code, {"a": ints, "b": a}) is None
+
+
+@pytest.mark.skipif(utils.numexpr is None, reason="requires numexpr")
+def test_call_or_eval_large_arrays_with_user_function():
+    "A user function is called even if numexpr has a function of that name."
+    n = 2 * utils._NUMEXPR_MIN_SIZE
+    I0 = numpy.linspace(1, 2, n)
+    run = build_simple_run({"I0": I0})
+
+    def log(x):
+        return numpy.log10(x)
+
+    result = call_or_eval({"x": "log(I0)"}, run, ["primary"], namespace={"log": log})
+    assert numpy.allclose(result["x"], numpy.log10(I0))
+
+
+@pytest.mark.skipif(utils.numexpr is None, reason="requires numexpr")
+def test_numexpr_unsupported_is_bounded(monkeypatch):
+    "Only the most recently used failing expressions are remembered."
+    monkeypatch.setattr(utils, "_NUMEXPR_UNSUPPORTED_MAXSIZE", 2)
+    monkeypatch.setattr(utils, "_numexpr_unsupported", collections.OrderedDict())
+    a = numpy.linspace(1, 2, 2 * utils._NUMEXPR_MIN_SIZE)
+    # numexpr does not support indexing, so these expressions fail.
+    expressions = ["a[::2]", "a[::3]", "a[::2]", "a[::4]"]
+    for expression in expressions:
+        code = compile(expression, "<expression>", "eval")
+        assert utils._evaluate_with_numexpr(expression, code, {"a": a}) is None
+    assert [key[0] for key in utils._numexpr_unsupported] == ["a[::2]", "a[::4]"]
+
+
 def test_call_or_eval_with_user_namespace():
     "Test that user-injected items in the namespace are found."
     run = build_simple_run({"motor": [1, 2], "det": [10, 20]})
@@ -1,21 +1,161 @@
 import collections
-import functools
-import itertools
 
 import numpy
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from .plot_specs import (
     Figure,
     Axes,
     Image,
     Line,
 )
-from .utils import auto_label, call_or_eval, RunManager, run_is_live_and_not_completed
+from .utils import (
+    auto_label,
+    call_or_eval,
+    RunManager,
+    run_is_completed,
+    run_is_live_and_not_completed,
+)
 from ..utils.dict_view import DictView
 from ..utils.event import EmitterGroup, Event
 from ..utils.list import EventedList
 
 
+def _snake_fill_numpy(image_data, data, snaking_col):
+    """
+    Place the points of a raster scan into a 2D image, in place.
+
+    Parameters
+    ----------
+    image_data : Array
+        2D array of shape (rows, cols), already filled with NaN
+    data : Array
+        1D array of values, in the order they were acquired
+    snaking_col : Boolean
+        If True, odd rows are traversed right to left.
+    """
+    # Copy whole rows as 2D blocks, then the partially-filled last row, if any.
+    # For a snaking raster, odd rows are copied from a reversed view of the
+    # data, so there is still only one pass and no index arithmetic.
+    n_cols = image_data.shape[1]
+    n_full, n_rest = divmod(len(data), n_cols)
+    n_in_full = n_full * n_cols
+    full = data[:n_in_full].reshape(n_full, n_cols)
+    rest = data[n_in_full:]
+    if not snaking_col:
+        image_data[:n_full] = full
+        if n_rest:
+            image_data[n_full, :n_rest] = rest
+        return
+    image_data[:n_full:2] = full[::2]
+    image_data[1:n_full:2] = full[1::2, ::-1]
+    if n_rest:
+        if n_full & 1:
+            # This row runs right to left, so its points fill the right end.
+            image_data[n_full, -n_rest:] = rest[::-1]
+        else:
+            image_data[n_full, :n_rest] = rest
+
+
+def _snake_fill_loop(image_data, data, snaking_col):
+    "Equivalent to _snake_fill_numpy, written as a loop to be compiled by numba."
+    n_cols = image_data.shape[1]
+    n_points = data.shape[0]
+    # Walk one row at a time, deciding its direction once per row, so the inner
+    # loops are plain strided copies with no per-point division or branching.
+    start = 0
+    row = 0
+    while start < n_points:
+        stop = min(start + n_cols, n_points)
+        if snaking_col and (row & 1):
+            for i in range(start, stop):
+                image_data[row, n_cols - 1 - (i - start)] = data[i]
+        else:
+            for i in range(start, stop):
+                image_data[row, i - start] = data[i]
+        start = stop
+        row += 1
+
+
+# numba is optional. Without it, fall back to the vectorized numpy code, which
+# is nearly as fast.
+if numba is None:
+    _snake_fill = _snake_fill_numpy
+else:
+    _snake_fill = numba.njit(cache=True)(_snake_fill_loop)
+
+
+class _CachedTransform:
+    """
+    Bind arguments to a transform, like functools.partial, and cache results.
+
+    A completed Run will never change, so the transform is evaluated once per
+    Run and later redraws reuse the result. For a Run in progress, the result
+    is reused until new data arrives in one of the streams the transform needs;
+    data arriving in other streams (e.g. "baseline") does not cause it to be
+    recomputed. The cache lives and dies with the artist holding this callable,
+    so it is dropped when the Run is removed.
+
+    The artist re-emits the Run's ``new_data`` events, and views redraw it in
+    response, so the cache must be invalidated before that happens. The artist
+    subscribes when it is created, before this callable is first evaluated, so
+    this callable subscribes with ``position="first"`` to be notified ahead of
+    every earlier subscriber. This relies on the ordering of callbacks by
+    bluesky_live's ``EventEmitter.connect``.
+    """
+
+    __slots__ = (
+        "_transform",
+        "_needs_streams",
+        "_kwargs",
+        "_cache",
+        "_generations",
+        "__weakref__",
+    )
+
+    def __init__(self, transform, needs_streams, **kwargs):
+        self._transform = transform
+        self._needs_streams = tuple(needs_streams)
+        self._kwargs = kwargs
+        # Map Run uid to (generation, result of the transform).
+        self._cache = {}
+        # Map uid of a live Run in progress to a count of the updates it has
+        # received in the streams we need.
+        self._generations = {}
+
+    def __call__(self, run):
+        uid = run.metadata["start"]["uid"]
+        if run_is_live_and_not_completed(run):
+            if uid not in self._generations:
+                self._generations[uid] = 0
+                run.events.new_data.connect(self._on_new_data, position="first")
+            generation = self._generations[uid]
+        elif run_is_completed(run):
+            if self._generations.pop(uid, None) is not None:
+                run.events.new_data.disconnect(self._on_new_data)
+            generation = None
+        else:
+            # This Run is at rest but incomplete. We cannot know if it changes.
+            return self._transform(run, **self._kwargs)
+        try:
+            cached_generation, result = self._cache[uid]
+        except KeyError:
+            cached_generation, result = (), None
+        if cached_generation != generation:
+            result = self._transform(run, **self._kwargs)
+            self._cache[uid] = (generation, result)
+        # Return a fresh dict so that callers cannot alter the cached one.
+        return dict(result)
+
+    def _on_new_data(self, event):
+        if any(name in event.updated for name in self._needs_streams):
+            self._generations[event.run.metadata["start"]["uid"]] += 1
+
+
 class Lines:
     """
     Plot ys vs x for the last N runs.
@@ -157,18 +297,14 @@ class Lines:
         super().__init__()
 
         if label_maker is None:
-            # scan_id is always generated by RunEngine but not stricter required by
-            # the schema, so we fail gracefully if it is missing.
-            def label_maker(run, y):
-                return (
-                    f"Scan {run.metadata['start'].get('scan_id', '?')} "
-                    f"{auto_label(y)}"
-                )
+            label_maker = self._default_label_maker
 
         self._x = x
         if isinstance(ys, str):
             raise ValueError("`ys` must be a list of strings, not a string")
         self._ys = EventedList(ys)
+        # Maps ys to auto_label(y), so it is not recomputed for every line.
+        self._auto_labels = {}
         # Maps ys to set of ArtistSpec.
         self._ys_to_artists = collections.defaultdict(list)
         self._label_maker = label_maker
@@ -176,7 +312,7 @@ class Lines:
         if axes is None:
             axes = Axes(
                 x_label=auto_label(self.x),
-                y_label=", ".join(auto_label(y) for y in self.ys),
+                y_label=self._default_y_label(),
             )
             figure = Figure((axes,), title="")
         else:
@@ -204,7 +340,8 @@ class Lines:
         # Keep y_label up to date with self.ys or leave it as user-defined value
         self._control_y_label = self.axes.y_label == self._default_y_label()
 
-        self._color_cycle = itertools.cycle(f"C{i}" for i in range(10))
+        self._colors = tuple(f"C{i}" for i in range(10))
+        self._color_index = 0
 
         self._run_manager = RunManager(max_runs, needs_streams)
         self._run_manager.events.run_ready.connect(self._add_lines)
@@ -219,8 +356,31 @@ class Lines:
         self.ys.events.added.connect(self._add_ys)
         self.ys.events.removed.connect(self._remove_ys)
 
+    def _next_color(self):
+        "Return the next color in the cycle."
+        color = self._colors[self._color_index % len(self._colors)]
+        self._color_index += 1
+        return color
+
+    def reset_colors(self):
+        "Start the color cycle over, so that the next line gets the first color."
+        self._color_index = 0
+
+    def _default_label_maker(self, run, y):
+        # scan_id is always generated by RunEngine but not stricter required by
+        # the schema, so we fail gracefully if it is missing.
+        scan_id = run.metadata["start"].get("scan_id", "?")
+        return f"Scan {scan_id} {self._auto_label(y)}"
+
+    def _auto_label(self, y):
+        try:
+            return self._auto_labels[y]
+        except KeyError:
+            label = self._auto_labels[y] = auto_label(y)
+            return label
+
     def _default_y_label(self):
-        return ", ".join(auto_label(y) for y in self.ys)
+        return ", ".join(self._auto_label(y) for y in self.ys)
 
     def _default_title(self):
         return f"{self._default_y_label()} v {self.axes.x_label}"
@@ -236,31 +396,11 @@ class Lines:
             self.title = self._default_title()
 
         run = event.run
+        # These are the same for every y, so look them up once.
+        is_live = run_is_live_and_not_completed(run)
+        is_pinned = run.metadata["start"]["uid"] in self.pinned
         for y in self.ys:
-            label = self._label_maker(run, y)
-            # If run is in progress, give it a special color so it stands out.
-            if run_is_live_and_not_completed(run):
-                color = "black"
-
-                def restyle_line_when_complete(event):
-                    "When run is complete, update style."
-                    line.style.update({"color": next(self._color_cycle)})
-
-                run.events.completed.connect(restyle_line_when_complete)
-            else:
-                color = next(self._color_cycle)
-            style = {"color": color}
-
-            # Style pinned runs differently.
-            if run.metadata["start"]["uid"] in self.pinned:
-                style.update(linestyle="dashed")
-                label += " (pinned)"
-
-            func = functools.partial(self._transform, x=self.x, y=y)
-            line = Line.from_run(func, run, label, style)
-            self._run_manager.track_artist(line, [run])
-            self.axes.artists.append(line)
-            self._ys_to_artists[y].append(line)
+            self._add_line(run, y, is_live, is_pinned)
 
     def _add_ys(self, event):
         "Add a y."
@@ -271,31 +411,38 @@ class Lines:
             self.title = self._default_title()
 
         y = event.item
+        pinned = self.pinned
         for run in self._run_manager.runs:
-            label = self._label_maker(run, y)
-            # If run is in progress, give it a special color so it stands out.
-            if run_is_live_and_not_completed(run):
-                color = "black"
-
-                def restyle_line_when_complete(event):
-                    "When run is complete, update style."
-                    line.style.update({"color": next(self._color_cycle)})
-
-                run.events.completed.connect(restyle_line_when_complete)
-            else:
-                color = next(self._color_cycle)
-            style = {"color": color}
-
-            # Style pinned runs differently.
-            if run.metadata["start"]["uid"] in self.pinned:
-                style.update(linestyle="dashed")
-                label += " (pinned)"
-
-            func = functools.partial(self._transform, x=self.x, y=y)
-            line = Line.from_run(func, run, label, style)
-            self._run_manager.track_artist(line, [run])
-            self.axes.artists.append(line)
-            self._ys_to_artists[y].append(line)
+            is_live = run_is_live_and_not_completed(run)
+            is_pinned = run.metadata["start"]["uid"] in pinned
+            self._add_line(run, y, is_live, is_pinned)
+
+    def _add_line(self, run, y, is_live, is_pinned):
+        "Add a line for one y from one Run."
+        label = self._label_maker(run, y)
+        # If run is in progress, give it a special color so it stands out.
+        if is_live:
+            color = "black"
+
+            def restyle_line_when_complete(event):
+                "When run is complete, update style."
+                line.style.update({"color": self._next_color()})
+
+            run.events.completed.connect(restyle_line_when_complete)
+        else:
+            color = self._next_color()
+        style = {"color": color}
+
+        # Style pinned runs differently.
+        if is_pinned:
+            style.update(linestyle="dashed")
+            label += " (pinned)"
+
+        func = _CachedTransform(self._transform, self.needs_streams, x=self.x, y=y)
+        line = Line.from_run(func, run, label, style)
+        self._run_manager.track_artist(line, [run])
+        self.axes.artists.append(line)
+        self._ys_to_artists[y].append(line)
 
     def _remove_ys(self, event):
         "Remove a y."
@@ -305,6 +452,7 @@ class Lines:
         if self._control_title:
             self.title = self._default_title()
         y = event.item
+        self._auto_labels.pop(y, None)
         for artist in self._ys_to_artists.pop(y):
             artist.axes.discard(artist)
 
@@ -340,7 +488,7 @@ class Lines:
 
     @property
     def pinned(self):
-        return self._run_manager._pinned
+        return self._run_manager.pinned
 
     # Expose axes title and y_label
 
@@ -450,12 +598,14 @@ class Images:
         if label_maker is None:
             # scan_id is always generated by RunEngine but not stricter required by
             # the schema, so we fail gracefully if it is missing.
+            # The field never changes, so its label is computed once.
+            field_label = auto_label(field)
 
             def label_maker(run, field):
                 md = run.metadata["start"]
                 return (
                     f"Scan ID {md.get('scan_id', '?')}   UID {md['uid'][:8]}   "
-                    f"{auto_label(field)}"
+                    f"{field_label}"
                 )
 
         self._field = field
@@ -485,7 +635,7 @@ class Images:
 
     def _add_images(self, event):
         run = event.run
-        func = functools.partial(self._transform, field=self.field)
+        func = _CachedTransform(self._transform, self.needs_streams, field=self.field)
         image = Image.from_run(func, run, label=self.field)
         self._run_manager.track_artist(image, [run])
         self.axes.artists.append(image)
@@ -494,13 +644,15 @@ class Images:
 
     def _transform(self, run, field):
         result = call_or_eval({"array": field}, run, self.needs_streams, self.namespace)
-        # If the data is more than 2D, take the middle slice from the leading
-        # axis until there are only two axes.
+        # If the data is more than 2D, take the middle slice along each leading
+        # axis until there are only two axes. Do it in one indexing operation
+        # so that a lazy (e.g. dask-backed) array reads only the slice we keep.
         data = result["array"]
-        while data.ndim > 2:
-            middle = data.shape[0] // 2
+        if data.ndim > 2:
+            middle = tuple(size // 2 for size in data.shape[:-2])
             data = data[middle]
-        result["array"] = data
+        # Only now, with the data reduced to 2D, read it into memory.
+        result["array"] = numpy.asarray(data)
         return result
 
     @property
@@ -531,7 +683,7 @@ class Images:
 
     @property
     def pinned(self):
-        return self._run_manager._pinned
+        return self._run_manager.pinned
 
 
 class RasteredImages:
@@ -662,9 +814,7 @@ class RasteredImages:
     @cmap.setter
     def cmap(self, value):
         self._cmap = value
-        for artist in self.axes.artists:
-            if isinstance(artist, Image):
-                artist.style.update({"cmap": value})
+        self._update_image_styles({"cmap": value})
 
     @property
     def clim(self):
@@ -673,9 +823,7 @@ class RasteredImages:
     @clim.setter
     def clim(self, value):
         self._clim = value
-        for artist in self.axes.artists:
-            if isinstance(artist, Image):
-                artist.style.update({"clim": value})
+        self._update_image_styles({"clim": value})
 
     @property
     def extent(self):
@@ -684,9 +832,13 @@ class RasteredImages:
     @extent.setter
     def extent(self, value):
         self._extent = value
-        for artist in self.axes.artist:
+        self._update_image_styles({"extent": value})
+
+    def _update_image_styles(self, update):
+        "Apply a style update to every image on the axes."
+        for artist in self.axes.artists:
             if isinstance(artist, Image):
-                artist.style.update({"extent": value})
+                artist.style.update(update)
 
     @property
     def x_positive(self):
@@ -740,7 +892,7 @@ class RasteredImages:
 
     def _add_image(self, event):
         run = event.run
-        func = functools.partial(self._transform, field=self.field)
+        func = _CachedTransform(self._transform, self.needs_streams, field=self.field)
         style = {"cmap": self._cmap, "clim": self._clim, "extent": self._extent}
         image = Image.from_run(func, run, label=self.field, style=style)
         self._run_manager.track_artist(image, [run])
@@ -766,16 +918,22 @@ class RasteredImages:
         ...
 
     def _transform(self, run, field):
-        image_data = numpy.ones(self._shape) * numpy.nan
         result = call_or_eval({"data": field}, run, self.needs_streams, self.namespace)
-        data = result["data"]
+        data = numpy.asarray(result["data"])
         snaking = run.metadata["start"]["snaking"]
-        for index in range(len(data)):
-            pos = list(numpy.unravel_index(index, self._shape))
-            if snaking[1] and (pos[0] % 2):
-                pos[1] = self._shape[1] - pos[1] - 1
-            pos = tuple(pos)
-            image_data[pos] = data[index]
+        # Write the NaN padding in a single pass, in the narrowest floating
+        # dtype that holds the data exactly: float32 for float32 data and for
+        # 8- and 16-bit integers, which are common for detectors.
+        dtype = numpy.result_type(data.dtype, numpy.float32)
+        image_data = numpy.full(self._shape, numpy.nan, dtype=dtype)
+        # The kernels expect the data to fit in the image. The numba kernel is
+        # compiled without bounds checks and would write past the end of it.
+        if len(data) > image_data.size:
+            raise ValueError(
+                f"The run has {len(data)} points, which do not fit in the raster "
+                f"of shape {tuple(self._shape)}."
+            )
+        _snake_fill(image_data, data, bool(snaking[1]))
         return {"array": image_data}
 
     @property
@@ -810,4 +968,4 @@ class RasteredImages:
 
     @property
     def pinned(self):
-        return self._run_manager._pinned
+        return self._run_manager.pinned
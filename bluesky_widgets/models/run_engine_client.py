@@ -7,6 +7,29 @@ from bluesky_live.event import EmitterGroup, Event
 from bluesky_queueserver.manager.comms import ZMQCommSendThreads, CommTimeoutError
 from bluesky_queueserver.manager.profile_ops import bind_plan_arguments
 
+# Indicates that no default value was passed to a function
+_NOT_SET = object()
+
+
+def _clone_item(obj):
+    """
+    Returns a deep copy of a queue item. Queue items are JSON-style structures (dictionaries,
+    lists and scalars), which are copied directly without using ``copy.deepcopy``. Objects
+    of other types (including subclasses of ``dict`` and ``list``) are copied with
+    ``copy.deepcopy``.
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {k: _clone_item(v) for k, v in obj.items()}
+    elif obj_type is list:
+        return [_clone_item(_) for _ in obj]
+    elif obj_type is tuple:
+        return tuple(_clone_item(_) for _ in obj)
+    elif (obj is None) or (obj_type in (str, int, float, bool)):
+        return obj
+    else:
+        return copy.deepcopy(obj)
+
 
 class RunEngineClient:
     """
@@ -503,13 +526,13 @@ class RunEngineClient:
 
         return item_args, item_kwargs
 
-    def get_item_value_for_label(self, *, item, label, as_str=True):
+    def get_item_value_for_label(self, *, item, label, as_str=True, default=_NOT_SET):
         """
         Returns parameter value of the item for given label (e.g. table column name). Returns
         value represented as a string if `as_str=True`, otherwise returns value itself. Raises
-        `KeyError` if the label or parameter is not found. It is not guaranteed that item
-        dictionaries always contain all parameters, so exception does not indicate an error
-        and should be processed by application.
+        `KeyError` if the label or parameter is not found, unless `default` is passed. It is
+        not guaranteed that item dictionaries always contain all parameters, so exception does
+        not indicate an error and should be processed by application.
 
         Parameters
         ----------
@@ -519,6 +542,9 @@ class RunEngineClient:
             Label (e.g. table column name)
         as_str : boolean
             ``True`` - return string representation of the value, otherwise return the value
+        default : object, optional
+            Value returned if the label or parameter is not found. Passing the default value is
+            faster than catching the exception if many items are missing parameters.
 
         Returns
         -------
@@ -528,68 +554,125 @@ class RunEngineClient:
         Raises
         ------
         KeyError
-            label or parameter is not found in the dictionary
+            label or parameter is not found in the dictionary and ``default`` is not passed
         """
-        try:
-            key_seq = self._map_column_labels_to_keys[label]
-        except KeyError:
+        key_seq = self._map_column_labels_to_keys.get(label, None)
+        if key_seq is None:
+            if default is not _NOT_SET:
+                return default
             raise KeyError("Label 'label' is not found in the map dictionary")
 
-        # Follow the path in the dictionary. 'KeyError' exception is raised if a key does not exist
-        try:
-            value = item
-            if (len(key_seq) == 1) and (key_seq[-1] in ("args", "kwargs")):
-                # Special case: combine args and kwargs to be displayed in one column
-                value = {
-                    "args": value.get("args", []),
-                    "kwargs": value.get("kwargs", {}),
-                }
-            else:
-                for key in key_seq:
-                    value = value[key]
-        except KeyError:
-            raise KeyError(
-                f"Parameter with keys {key_seq} is not found in the item dictionary"
-            )
-
-        if as_str:
-            key = key_seq[-1]
-
-            s = ""
-            if key in ("args", "kwargs"):
-                value["args"], value["kwargs"] = self.get_bound_item_arguments(item)
-
-                s_args, s_kwargs = "", ""
-                if value["args"] and isinstance(
-                    value["args"], collections.abc.Iterable
-                ):
-                    s_args = ", ".join(f"{v}" for v in value["args"])
-                if value["kwargs"] and isinstance(
-                    value["kwargs"], collections.abc.Mapping
-                ):
-                    s_kwargs = ", ".join(
-                        f"{k}: {v}" for k, v in value["kwargs"].items()
+        # Follow the path in the dictionary
+        value = item
+        if (len(key_seq) == 1) and (key_seq[-1] in ("args", "kwargs")):
+            # Special case: combine args and kwargs to be displayed in one column
+            value = {
+                "args": value.get("args", []),
+                "kwargs": value.get("kwargs", {}),
+            }
+        else:
+            for key in key_seq:
+                value = value.get(key, _NOT_SET)
+                if value is _NOT_SET:
+                    if default is not _NOT_SET:
+                        return default
+                    raise KeyError(
+                        f"Parameter with keys {key_seq} is not found in the item dictionary"
                     )
-                s = ", ".join([_ for _ in [s_args, s_kwargs] if _])
 
-            elif key == "args":
-                if value and isinstance(value, collections.abc.Iterable):
-                    s = ", ".join(f"{v}" for v in value)
+        if as_str:
+            value = self._format_item_value(item=item, key=key_seq[-1], value=value)
 
-            elif key == "item_type":
-                # Print capitalized first letter of the item type ('P' or 'I')
-                s_tmp = str(value)
-                if s_tmp:
-                    s = s_tmp[0].upper()
+        return value
 
-            else:
-                s = str(value)
+    def _format_item_value(self, *, item, key, value):
+        """
+        Returns string representation of the item parameter ``value`` found in the item
+        dictionary under ``key`` (the last key in the sequence of keys).
+        """
+        s = ""
+        if key in ("args", "kwargs"):
+            value["args"], value["kwargs"] = self.get_bound_item_arguments(item)
+
+            s_args, s_kwargs = "", ""
+            if value["args"] and isinstance(value["args"], collections.abc.Iterable):
+                s_args = ", ".join(f"{v}" for v in value["args"])
+            if value["kwargs"] and isinstance(value["kwargs"], collections.abc.Mapping):
+                s_kwargs = ", ".join(f"{k}: {v}" for k, v in value["kwargs"].items())
+            s = ", ".join([_ for _ in [s_args, s_kwargs] if _])
+
+        elif key == "item_type":
+            # Print capitalized first letter of the item type ('P' or 'I')
+            s_tmp = str(value)
+            if s_tmp:
+                s = s_tmp[0].upper()
 
         else:
-            s = value
+            s = str(value)
 
         return s
 
+    def make_value_getter(self, label, *, as_str=True, default=""):
+        """
+        Returns a function ``getter(item)`` equivalent to
+        ``get_item_value_for_label(item=item, label=label, as_str=as_str, default=default)``.
+        The label is looked up in the map only once, so the getter is faster if the value
+        is computed for many items (e.g. for each row of a table). The getter must be
+        created again if the map is changed with ``set_map_param_labels_to_keys``.
+
+        Parameters
+        ----------
+        label : str
+            Label (e.g. table column name)
+        as_str : boolean
+            ``True`` - return string representation of the value, otherwise return the value
+        default : object, optional
+            Value returned if the label or parameter is not found.
+
+        Returns
+        -------
+        callable
+            function that accepts item dictionary and returns the value
+        """
+        key_seq = self._map_column_labels_to_keys.get(label, None)
+        if key_seq is None:
+            return lambda item: default
+
+        key_seq, key = tuple(key_seq), key_seq[-1]
+        format_value = self._format_item_value
+
+        if (len(key_seq) == 1) and (key in ("args", "kwargs")):
+            # Special case: combine args and kwargs to be displayed in one column
+            def getter(item):
+                value = {"args": item.get("args", []), "kwargs": item.get("kwargs", {})}
+                return (
+                    format_value(item=item, key=key, value=value) if as_str else value
+                )
+
+        elif len(key_seq) == 1:
+
+            def getter(item):
+                value = item.get(key, _NOT_SET)
+                if value is _NOT_SET:
+                    return default
+                return (
+                    format_value(item=item, key=key, value=value) if as_str else value
+                )
+
+        else:
+
+            def getter(item):
+                value = item
+                for k in key_seq:
+                    value = value.get(k, _NOT_SET)
+                    if value is _NOT_SET:
+                        return default
+                return (
+                    format_value(item=item, key=key, value=value) if as_str else value
+                )
+
+        return getter
+
     # ============================================================================
     #                         Queue operations
 
@@ -631,7 +714,7 @@ class RunEngineClient:
         if item_uid:
             sel_item_pos = self.queue_item_uid_to_pos(item_uid)
             if sel_item_pos >= 0:
-                return copy.deepcopy(self._plan_queue_items[sel_item_pos])
+                return _clone_item(self._plan_queue_items[sel_item_pos])
         return None
 
     def queue_item_move_up(self):
@@ -1,10 +1,20 @@
-import ast
 import collections
 import contextlib
+import functools
 import inspect
 
 import numpy
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import xarray
+except ImportError:
+    xarray = None
+
 from ..utils.list import EventedList
 from ..utils.event import EmitterGroup, Event
 
@@ -223,15 +233,20 @@ def call_or_eval_one(item, namespace):
             pass
         # Check whether it is valid Python syntax.
         try:
-            ast.parse(item)
+            code = _compile_expression(item)
         except SyntaxError as err:
             raise ValueError(
                 f"Could find {item!r} in namespace or parse it as "
                 "a Python expression."
             ) from err
+        # For long columns, numexpr can evaluate the whole expression in one
+        # pass without allocating a temporary array for each operator.
+        result = _evaluate_with_numexpr(item, code, namespace)
+        if result is not None:
+            return result
         # Try to evaluate it as a Python expression in the namespace.
         try:
-            return eval(item, namespace)
+            return eval(code, namespace)
         except Exception as err:
             raise ValueError(
                 f"Could find {item!r} in namespace or evaluate it."
@@ -243,6 +258,145 @@ def call_or_eval_one(item, namespace):
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_expression(expression):
+    """
+    Compile a string expression to a code object.
+
+    The same few expressions are evaluated every time a plot is updated, so
+    cache the result rather than parsing them again on each call.
+    """
+    return compile(expression, "<expression>", "eval")
+
+
+# Below this many elements, the overhead of numexpr outweighs its benefit.
+_NUMEXPR_MIN_SIZE = 4096
+# numexpr promotes types differently from numpy (e.g. float32 with int32 gives
+# float32, not float64), so it is used only for arrays of this dtype, for which
+# the results are the same as with eval.
+_NUMEXPR_DTYPE = numpy.dtype("float64")
+# Functions that numexpr implements in the same way as the numpy function of
+# the same name. Any other callable in an expression is left to eval.
+_NUMEXPR_FUNCTIONS = frozenset(
+    [
+        "sin",
+        "cos",
+        "tan",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "arctan2",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arcsinh",
+        "arccosh",
+        "arctanh",
+        "log",
+        "log10",
+        "log1p",
+        "exp",
+        "expm1",
+        "sqrt",
+        "abs",
+        "conj",
+    ]
+)
+# Expressions that numexpr has failed to evaluate, with the types and dtypes of
+# the arrays they were evaluated on. Do not try them again with the same inputs.
+# The least recently used entries are dropped, as in _compile_expression.
+_NUMEXPR_UNSUPPORTED_MAXSIZE = 1024
+_numexpr_unsupported = collections.OrderedDict()
+
+
+def _evaluate_with_numexpr(expression, code, namespace):
+    """
+    Try to evaluate an expression with numexpr.
+
+    Only expressions on float64 arrays of a single type (all numpy arrays or
+    all xarray DataArrays with matching coordinates) are evaluated, and the
+    result has the same type as the inputs, as it would with eval.
+
+    Returns None if numexpr is not installed, if the arrays involved are too
+    small to benefit from it or are not supported, or if numexpr cannot handle
+    the expression (for example, if it uses indexing or a function other than
+    the numpy functions that numexpr implements). The caller should then fall
+    back to eval.
+    """
+    if numexpr is None:
+        return None
+    local_dict = {}
+    arrays = []
+    for name in code.co_names:
+        try:
+            value = namespace[name]
+        except KeyError:
+            # This may be a function that numexpr provides, such as log.
+            continue
+        if isinstance(value, (int, float, complex)):
+            local_dict[name] = value
+        elif (type(value) is numpy.ndarray) or (
+            xarray is not None and type(value) is xarray.DataArray
+        ):
+            local_dict[name] = value
+            arrays.append(value)
+        elif callable(value):
+            # numexpr uses its own version of the function, which is only the
+            # same as this one if this is the numpy function of that name.
+            if name not in _NUMEXPR_FUNCTIONS or value is not getattr(numpy, name):
+                return None
+        else:
+            # A stream, the run, or some other object numexpr cannot use
+            return None
+    if not arrays or max(array.size for array in arrays) < _NUMEXPR_MIN_SIZE:
+        return None
+    array_type = type(arrays[0])
+    if any(type(array) is not array_type for array in arrays):
+        return None
+    if any(array.dtype != _NUMEXPR_DTYPE for array in arrays):
+        return None
+    key = (
+        expression,
+        tuple(
+            (name, type(value), getattr(value, "dtype", None))
+            for name, value in local_dict.items()
+        ),
+    )
+    if key in _numexpr_unsupported:
+        _numexpr_unsupported.move_to_end(key)
+        return None
+    template = None
+    if array_type is not numpy.ndarray:
+        # DataArrays would be aligned and broadcast by eval. Only handle the
+        # simple case of identical dimensions and coordinates.
+        template = arrays[0]
+        if any(array.dims != template.dims for array in arrays):
+            return None
+        try:
+            xarray.align(*arrays, join="exact", copy=False)
+        except ValueError:
+            return None
+        local_dict = {name: numpy.asarray(value) for name, value in local_dict.items()}
+    try:
+        result = numexpr.evaluate(expression, local_dict=local_dict, global_dict={})
+    except Exception:
+        _numexpr_unsupported[key] = None
+        if len(_numexpr_unsupported) > _NUMEXPR_UNSUPPORTED_MAXSIZE:
+            _numexpr_unsupported.popitem(last=False)
+        return None
+    if template is None:
+        return result
+    if result.shape != template.shape:
+        return None
+    # As with xarray arithmetic, the name is kept only if all inputs share it.
+    name = template.name
+    if any(array.name != name for array in arrays):
+        name = None
+    return xarray.DataArray(
+        result, coords=template.coords, dims=template.dims, name=name
+    )
+
+
 def auto_label(callable_or_expr):
     """
     Given a callable or a string, extract a name for labeling axes.
@@ -279,9 +433,15 @@ class RunManager:
         self._max_runs = int(max_runs)
         self._needs_streams = tuple(needs_streams)
         self.runs = RunList()
-        self._pinned = set()
-        # Maps Run (uid) to set of ArtistSpec.
-        self._runs_to_artists = collections.defaultdict(list)
+        # Pins change rarely but are read for every artist, so store an
+        # immutable set that can be handed out without copying.
+        self._pinned = frozenset()
+        # Maps uid to Run for the unpinned Runs, oldest first, so that culling
+        # does not have to scan past the pinned ones.
+        self._unpinned = collections.OrderedDict()
+        # Maps Run (uid) to list of ArtistSpec. Runs that never became ready
+        # have no entry.
+        self._runs_to_artists = {}
 
         self.runs.events.added.connect(self._on_run_added)
         self.runs.events.removed.connect(self._on_run_removed)
@@ -298,7 +458,7 @@ class RunManager:
             If True, retain this Run until it is removed by the user.
         """
         if pinned:
-            self._pinned.add(run.metadata["start"]["uid"])
+            self._pinned |= {run.metadata["start"]["uid"]}
         self.runs.append(run)
 
     def discard_run(self, run):
@@ -336,15 +496,17 @@ class RunManager:
             )
         (run,) = runs
         run_uid = run.metadata["start"]["uid"]
-        self._runs_to_artists[run_uid].append(artist)
+        self._runs_to_artists.setdefault(run_uid, []).append(artist)
 
     def _cull_runs(self):
-        "Remove Runs from the beginning of self.runs to keep the length <= max_runs."
-        i = 0
-        while len(self.runs) > self.max_runs + len(self._pinned):
-            while self.runs[i].metadata["start"]["uid"] in self._pinned:
-                i += 1
-            self.runs.pop(i)
+        "Remove the oldest unpinned Runs to keep their number <= max_runs."
+        while len(self._unpinned) > self.max_runs:
+            _, run = self._unpinned.popitem(last=False)
+            self.runs.remove(run)
+
+    def _has_needed_streams(self, run):
+        "True if the Run has all the streams we need, checked by key lookup."
+        return all(stream_name in run for stream_name in self._needs_streams)
 
     def _on_run_added(self, event):
         """
@@ -352,29 +514,37 @@ class RunManager:
 
         By "ready" we mean, it has all the streams it needs to be drawn.
         """
-        self._cull_runs()
         run = event.item
+        run_uid = run.metadata["start"]["uid"]
+        if run_uid not in self._pinned:
+            self._unpinned[run_uid] = run
+        self._cull_runs()
         if run_is_live_and_not_completed(run):
             # If the stream of interest is defined already, plot now.
-            if set(self.needs_streams).issubset(set(list(run))):
+            if self._has_needed_streams(run):
                 self.events.run_ready(run=run)
             else:
                 # Otherwise, connect a callback to run when the stream of interest arrives.
                 run.events.new_stream.connect(self._on_new_stream)
         else:
-            if set(self.needs_streams).issubset(set(list(run))):
+            if self._has_needed_streams(run):
                 self.events.run_ready(run=run)
 
     def _on_run_removed(self, event):
         "Remove any extant artists if its corresponding Run is removed."
-        run_uid = event.item.metadata["start"]["uid"]
-        self._pinned.discard(run_uid)
-        for artist in self._runs_to_artists.pop(run_uid):
+        run = event.item
+        run_uid = run.metadata["start"]["uid"]
+        self._pinned -= {run_uid}
+        self._unpinned.pop(run_uid, None)
+        if run_is_live(run):
+            # If the Run was still waiting for a stream, stop waiting.
+            run.events.new_stream.disconnect(self._on_new_stream)
+        for artist in self._runs_to_artists.pop(run_uid, ()):
             artist.axes.discard(artist)
 
     def _on_new_stream(self, event):
         "When an unready Run get a new stream, check it if is now ready."
-        if set(self.needs_streams).issubset(set(list(event.run))):
+        if self._has_needed_streams(event.run):
             self.events.run_ready(run=event.run)
             event.run.events.new_stream.disconnect(self._on_new_stream)
 
@@ -389,7 +559,7 @@ class RunManager:
 
     @property
     def pinned(self):
-        return frozenset(self._pinned)
+        return self._pinned
 
     @property
     def needs_streams(self):
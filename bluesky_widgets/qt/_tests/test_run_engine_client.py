@@ -0,0 +1,582 @@
+import copy
+
+import pytest
+from qtpy import sip
+from qtpy.QtCore import Qt
+
+from ...models.run_engine_client import RunEngineClient
+from ...qt.run_engine_client import (
+    QtReManagerConnection,
+    QtRePlanHistory,
+    _EditorTableCell,
+    _EditorTableModel,
+    _ItemTableModel,
+    _QtRePlanEditorTable,
+    _QueueTableModel,
+    _StatusSnapshot,
+)
+
+
+def _plan_item(item_uid, name="count", args=None, kwargs=None):
+    return {
+        "item_uid": item_uid,
+        "item_type": "plan",
+        "name": name,
+        "args": args or [],
+        "kwargs": kwargs or {},
+        "user": "Test User",
+        "user_group": "admin",
+    }
+
+
+_ALLOWED_PLANS = {
+    "count": {
+        "name": "count",
+        "description": "Take one or more readings from detectors.",
+        "parameters": [
+            {
+                "name": "detectors",
+                "kind": {"name": "POSITIONAL_OR_KEYWORD", "value": 1},
+            },
+            {
+                "name": "num",
+                "kind": {"name": "POSITIONAL_OR_KEYWORD", "value": 1},
+                "default": "1",
+            },
+            {
+                "name": "delay",
+                "kind": {"name": "POSITIONAL_OR_KEYWORD", "value": 1},
+                "default": "0",
+            },
+        ],
+    }
+}
+
+
+@pytest.fixture
+def re_model():
+    model = RunEngineClient()
+    model._allowed_plans.update(copy.deepcopy(_ALLOWED_PLANS))
+    return model
+
+
+def _queue_rows(*names):
+    return [(name, f"args of {name}", "Test User") for name in names]
+
+
+@pytest.mark.parametrize(
+    "old_names, new_names, changed, inserted, removed",
+    [
+        # Rows appended
+        ("abc", "abcde", [], [(3, 4)], []),
+        # Rows removed from the end
+        ("abcde", "abc", [], [], [(3, 4)]),
+        # Row removed from the middle: the following rows are shifted up
+        ("abcde", "abde", [(2, 3)], [], [(4, 4)]),
+        # Rows reordered
+        ("abcde", "adcbe", [(1, 3)], [], []),
+        # The same number of rows, one row changed
+        ("abcde", "abxde", [(2, 2)], [], []),
+        # Nothing changed
+        ("abcde", "abcde", [], [], []),
+        ("", "ab", [], [(0, 1)], []),
+        ("ab", "", [], [], [(0, 1)]),
+    ],
+)
+def test_queue_table_model_set_rows(
+    qtbot, qtmodeltester, old_names, new_names, changed, inserted, removed
+):
+    table_model = _QueueTableModel(("Name", "Parameters", "USER"))
+    table_model.set_rows(_queue_rows(*old_names))
+    qtmodeltester.check(table_model)
+
+    signals = {"changed": [], "inserted": [], "removed": []}
+    table_model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=None: signals["changed"].append(
+            (top_left.row(), bottom_right.row())
+        )
+    )
+    table_model.rowsInserted.connect(
+        lambda parent, first, last: signals["inserted"].append((first, last))
+    )
+    table_model.rowsRemoved.connect(
+        lambda parent, first, last: signals["removed"].append((first, last))
+    )
+
+    with qtbot.assertNotEmitted(table_model.modelReset):
+        table_model.set_rows(_queue_rows(*new_names))
+
+    assert signals == {"changed": changed, "inserted": inserted, "removed": removed}
+    assert [
+        tuple(table_model.data(table_model.index(row, col)) for col in range(3))
+        for row in range(table_model.rowCount())
+    ] == _queue_rows(*new_names)
+
+
+def test_manager_connection_stops_poll_thread_on_close(qtbot, re_model):
+    widget = QtReManagerConnection(re_model)
+    qtbot.addWidget(widget)
+
+    widget._start_poll_thread()
+    thread = widget._poll_thread
+    assert thread.parent() is widget
+    assert thread.isRunning()
+
+    widget.close()
+    assert not thread.isRunning()
+
+    # The same thread is started again on the next connection
+    widget._start_poll_thread()
+    assert widget._poll_thread is thread
+    assert thread.isRunning()
+    widget.close()
+
+
+def test_manager_connection_stops_poll_thread_on_destroy(qtbot, re_model):
+    widget = QtReManagerConnection(re_model)
+    widget._start_poll_thread()
+
+    # Qt aborts if a running thread is deleted, the thread is stopped before it is deleted
+    n_finished = []
+    widget._poll_thread.finished.connect(
+        lambda: n_finished.append(1), Qt.DirectConnection
+    )
+    sip.delete(widget)
+    assert n_finished == [1]
+
+
+def test_manager_connection_poll_backoff(qtbot, re_model):
+    widget = QtReManagerConnection(re_model)
+    qtbot.addWidget(widget)
+    widget.updates_activated = True
+    widget._poll_timer.start(1000)
+
+    # The period is doubled after 5 polls returning the same status, up to 4 s
+    intervals = []
+    for _ in range(8):
+        widget._poll_complete()
+        intervals.append(widget._poll_timer.interval())
+    assert intervals == [1000] * 5 + [2000, 4000, 4000]
+
+    # Any change of the status returns the period to 1 s
+    widget.on_update_widgets(_StatusSnapshot({}, True))
+    assert widget._poll_timer.interval() == 1000
+    widget._poll_complete()
+    assert widget._poll_timer.interval() == 1000
+    widget._poll_timer.stop()
+
+
+def _item_table_model(formatted):
+    def get_row_values(item):
+        formatted.append(item["item_uid"])
+        return (item["name"], item["item_uid"])
+
+    return _ItemTableModel(("Name", "UID"), get_row_values)
+
+
+def _item_table_rows(table_model):
+    return [
+        tuple(table_model.data(table_model.index(row, col)) for col in range(2))
+        for row in range(table_model.rowCount())
+    ]
+
+
+def test_item_table_model_items_appended(qtbot, qtmodeltester):
+    formatted = []
+    table_model = _item_table_model(formatted)
+    table_model.set_items([_plan_item("uid1"), _plan_item("uid2")])
+    qtmodeltester.check(table_model)
+    assert _item_table_rows(table_model) == [("count", "uid1"), ("count", "uid2")]
+
+    # New items are added to the history: only the new rows are inserted
+    inserted = []
+    table_model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    items = [_plan_item(f"uid{n}") for n in range(1, 5)]
+    with qtbot.assertNotEmitted(table_model.modelReset):
+        with qtbot.assertNotEmitted(table_model.dataChanged):
+            table_model.set_items(items)
+    assert inserted == [(2, 3)]
+
+    # The rows that were already formatted are not formatted again
+    formatted.clear()
+    assert _item_table_rows(table_model) == [("count", f"uid{n}") for n in range(1, 5)]
+    assert formatted == ["uid3", "uid4"]
+
+    # The same items
+    with qtbot.assertNotEmitted(table_model.modelReset):
+        with qtbot.assertNotEmitted(table_model.rowsInserted):
+            table_model.set_items(items)
+
+
+@pytest.mark.parametrize(
+    "new_uids",
+    [
+        ["uid2", "uid3"],  # The oldest item was removed
+        ["uid1", "uid3", "uid2"],  # Items replaced
+        [],  # History cleared
+    ],
+)
+def test_item_table_model_items_changed(qtbot, qtmodeltester, new_uids):
+    formatted = []
+    table_model = _item_table_model(formatted)
+    table_model.set_items([_plan_item("uid1"), _plan_item("uid2"), _plan_item("uid3")])
+    qtmodeltester.check(table_model)
+    _item_table_rows(table_model)
+
+    # The rows are formatted again after the model is reset
+    formatted.clear()
+    with qtbot.waitSignal(table_model.modelReset, timeout=1000):
+        table_model.set_items([_plan_item(uid, name=f"name_{uid}") for uid in new_uids])
+    assert _item_table_rows(table_model) == [(f"name_{uid}", uid) for uid in new_uids]
+    assert formatted == new_uids
+
+
+def test_item_table_model_refresh_rows(qtbot, qtmodeltester):
+    formatted = []
+    table_model = _item_table_model(formatted)
+    table_model.set_items([_plan_item("uid1"), _plan_item("uid2")])
+    qtmodeltester.check(table_model)
+    _item_table_rows(table_model)
+
+    formatted.clear()
+    with qtbot.waitSignal(table_model.dataChanged, timeout=1000) as blocker:
+        table_model.refresh_rows()
+    assert [index.row() for index in blocker.args[:2]] == [0, 1]
+    _item_table_rows(table_model)
+    assert formatted == ["uid1", "uid2"]
+
+
+def test_plan_history_allowed_plans_changed(qtbot, re_model):
+    """
+    The parameters of the plans in the history are bound to the signatures of the allowed
+    plans, so the rows are formatted again when the list of allowed plans changes.
+    """
+    widget = QtRePlanHistory(re_model)
+    qtbot.addWidget(widget)
+    table_model = widget._table.model()
+    column = widget._table_column_labels.index("Parameters")
+
+    items = [_plan_item(uid, args=[["det1"]]) for uid in ("uid1", "uid2")]
+    widget.slot_plan_history_changed(items, -1)
+    assert table_model.data(table_model.index(1, column)) == "detectors: ['det1']"
+
+    re_model._allowed_plans.clear()
+    with qtbot.waitSignal(table_model.dataChanged, timeout=1000):
+        re_model.events.allowed_plans_changed(allowed_plans={})
+    assert table_model.data(table_model.index(0, column)) == "['det1']"
+    assert table_model.data(table_model.index(1, column)) == "['det1']"
+
+    # The same history is not ignored after the allowed plans changed
+    assert widget._displayed_item_uids == ()
+    widget.slot_plan_history_changed(items, -1)
+    assert widget._displayed_item_uids == ("uid1", "uid2")
+
+
+def test_plan_history_keeps_column_widths(qtbot, re_model):
+    "The column widths are estimated only when the first items are added or the formatting changes."
+    widget = QtRePlanHistory(re_model)
+    qtbot.addWidget(widget)
+    header = widget._table.horizontalHeader()
+    column = widget._table_column_labels.index("Name")
+
+    items = [_plan_item(uid) for uid in ("uid1", "uid2")]
+    widget.slot_plan_history_changed(items, -1)
+    estimated_width = header.sectionSize(column)
+
+    # The width set by the user is kept when items are added
+    header.resizeSection(column, estimated_width + 100)
+    items = items + [_plan_item("uid3")]
+    widget.slot_plan_history_changed(items, -1)
+    assert header.sectionSize(column) == estimated_width + 100
+
+    # The widths are estimated again after the allowed plans change
+    widget.slot_allowed_plans_changed()
+    widget.slot_plan_history_changed(items, -1)
+    assert header.sectionSize(column) == estimated_width
+
+    # ... and when the items are added to the cleared history
+    header.resizeSection(column, estimated_width + 100)
+    widget.slot_plan_history_changed([], -1)
+    widget.slot_plan_history_changed(items, -1)
+    assert header.sectionSize(column) == estimated_width
+
+
+def _editor_text(table_model):
+    return [
+        [table_model.data(table_model.index(row, col)) for col in range(3)]
+        for row in range(table_model.rowCount())
+    ]
+
+
+def _editor_rows(n_rows):
+    return [
+        [_EditorTableCell(f"{row}-{col}") for col in range(3)] for row in range(n_rows)
+    ]
+
+
+def test_editor_table_model_set_data(qtbot, qtmodeltester):
+    table_model = _EditorTableModel(("Parameter", "", "Value"))
+    rows = _editor_rows(2)
+    rows[1][1] = None
+    rows[1][0].check_state = Qt.Unchecked
+    table_model.set_rows(rows)
+    qtmodeltester.check(table_model)
+
+    with qtbot.waitSignal(table_model.signal_cell_edited, timeout=1000) as blocker:
+        assert table_model.setData(table_model.index(0, 2), 10)
+    assert blocker.args == [0, 2]
+    assert table_model.data(table_model.index(0, 2)) == "10"
+
+    with qtbot.waitSignal(table_model.signal_cell_edited, timeout=1000) as blocker:
+        assert table_model.setData(
+            table_model.index(1, 0), Qt.Checked, Qt.CheckStateRole
+        )
+    assert blocker.args == [1, 0]
+    assert table_model.data(table_model.index(1, 0), Qt.CheckStateRole) == Qt.Checked
+
+    # Empty cells and cells without check boxes are not changed
+    with qtbot.assertNotEmitted(table_model.signal_cell_edited):
+        assert not table_model.setData(table_model.index(1, 1), "text")
+        assert not table_model.setData(
+            table_model.index(0, 0), Qt.Checked, Qt.CheckStateRole
+        )
+
+    # Changes made by calling the methods of the model are not reported as edits
+    with qtbot.assertNotEmitted(table_model.signal_cell_edited):
+        table_model.set_cells(0, {2: _EditorTableCell("new")})
+        table_model.set_foreground(0, 2, Qt.red)
+    assert table_model.data(table_model.index(0, 2)) == "new"
+    assert table_model.data(table_model.index(0, 2), Qt.ForegroundRole) == Qt.red
+
+
+@pytest.mark.parametrize("n_old, n_new", [(3, 5), (5, 3), (3, 3), (0, 2), (2, 0)])
+def test_editor_table_model_set_rows(qtbot, qtmodeltester, n_old, n_new):
+    table_model = _EditorTableModel(("Parameter", "", "Value"))
+    table_model.set_rows(_editor_rows(n_old))
+    qtmodeltester.check(table_model)
+
+    inserted, removed, changed = [], [], []
+    table_model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    table_model.rowsRemoved.connect(
+        lambda parent, first, last: removed.append((first, last))
+    )
+    table_model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=None: changed.append(
+            (top_left.row(), bottom_right.row())
+        )
+    )
+
+    rows = [
+        [_EditorTableCell(f"new {row}-{col}") for col in range(3)]
+        for row in range(n_new)
+    ]
+    with qtbot.assertNotEmitted(table_model.modelReset):
+        table_model.set_rows(rows)
+
+    n_common = min(n_old, n_new)
+    assert changed == ([(0, n_common - 1)] if n_common else [])
+    assert inserted == ([(n_old, n_new - 1)] if n_new > n_old else [])
+    assert removed == ([(n_new, n_old - 1)] if n_new < n_old else [])
+    assert _editor_text(table_model) == [
+        [f"new {row}-{col}" for col in range(3)] for row in range(n_new)
+    ]
+
+
+def test_plan_editor_fill_table_validates_once(qtbot, re_model):
+    widget = _QtRePlanEditorTable(re_model, editable=True)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    widget.show_item(item=_plan_item("uid1", kwargs={"detectors": ["det1"]}))
+    assert [row[0] for row in _editor_text(table_model)] == [
+        "detectors",
+        "num",
+        "delay",
+    ]
+
+    # The rows are replaced in the model (no reset), the values are validated once and
+    #   filling the table is not reported as editing
+    valid = []
+    widget.signal_parameters_valid.connect(valid.append)
+    with qtbot.assertNotEmitted(table_model.modelReset):
+        with qtbot.assertNotEmitted(table_model.signal_cell_edited):
+            widget.show_item(
+                item=_plan_item("uid2", kwargs={"detectors": ["det1"], "num": 3})
+            )
+    assert valid == [True]
+    assert widget.updatesEnabled()
+    assert not widget._item_modified
+
+
+@pytest.mark.parametrize("editable", [False, True])
+def test_plan_editor_cell_flags(qtbot, re_model, editable):
+    widget = _QtRePlanEditorTable(re_model, editable=editable)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    widget.show_item(
+        item=dict(
+            _plan_item("uid1", kwargs={"detectors": ["det1"]}), meta={"key": "value"}
+        )
+    )
+
+    def flags(row, col):
+        return table_model.flags(table_model.index(row, col))
+
+    selectable, enabled = Qt.ItemIsSelectable, Qt.ItemIsEnabled
+    # Parameter names and metadata are never editable
+    for row in range(table_model.rowCount()):
+        assert flags(row, 0) == selectable | enabled
+    assert [table_model.data(table_model.index(row, 0)) for row in (3, 4)] == [
+        "METADATA",
+        "- key",
+    ]
+    assert flags(4, 2) == selectable | enabled
+
+    # Required parameter 'detectors' is set, optional parameter 'num' is not set
+    editable_flag = Qt.ItemIsEditable if editable else Qt.NoItemFlags
+    assert flags(0, 2) == selectable | enabled | editable_flag
+    assert flags(1, 2) == selectable
+    # Only the check boxes of optional parameters are enabled
+    assert flags(0, 1) == selectable | Qt.ItemIsUserCheckable
+    assert flags(1, 1) == selectable | Qt.ItemIsUserCheckable | (
+        enabled if editable else Qt.NoItemFlags
+    )
+
+
+def test_plan_editor_text_color_changes_with_validity(qtbot, re_model):
+    widget = _QtRePlanEditorTable(re_model, editable=True)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    widget.show_item(item=_plan_item("uid1", kwargs={"detectors": ["det1"]}))
+    index = table_model.index(0, 2)
+
+    foreground_changes = []
+
+    def on_data_changed(top_left, bottom_right, roles=None):
+        if Qt.ForegroundRole in (roles or []):
+            foreground_changes.append(1)
+
+    table_model.dataChanged.connect(on_data_changed)
+
+    # Valid text replaced by other valid text: the color is not changed
+    table_model.setData(index, "['det2']")
+    assert foreground_changes == []
+    assert table_model.data(index, Qt.ForegroundRole) != widget._text_color_invalid
+
+    table_model.setData(index, "['det2'")
+    table_model.setData(index, "['det3'")
+    assert foreground_changes == [1]
+    assert table_model.data(index, Qt.ForegroundRole) == widget._text_color_invalid
+
+    table_model.setData(index, "['det3']")
+    assert foreground_changes == [1, 1]
+    assert table_model.data(index, Qt.ForegroundRole) != widget._text_color_invalid
+
+
+def test_plan_editor_check_box_updates_value_cell(qtbot, re_model):
+    widget = _QtRePlanEditorTable(re_model, editable=True)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    widget.show_item(item=_plan_item("uid1", kwargs={"detectors": ["det1"]}))
+
+    # The optional parameter 'num' displays the default value and can not be edited
+    assert _editor_text(table_model)[1] == ["num", "", "1 (default)"]
+    assert not table_model.flags(table_model.index(1, 2)) & Qt.ItemIsEditable
+
+    table_model.setData(table_model.index(1, 1), Qt.Checked, Qt.CheckStateRole)
+    assert _editor_text(table_model)[1] == ["num", "", "1"]
+    assert table_model.flags(table_model.index(1, 2)) & Qt.ItemIsEditable
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det1"], "num": 1}
+
+    table_model.setData(table_model.index(1, 1), Qt.Unchecked, Qt.CheckStateRole)
+    assert _editor_text(table_model)[1] == ["num", "", "1 (default)"]
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det1"]}
+
+
+def test_plan_editor_hidden_default_parameters(qtbot, re_model):
+    """
+    Parameters with default values are hidden in the non-detailed view, the table rows are
+    mapped to the displayed parameters.
+    """
+    widget = _QtRePlanEditorTable(re_model, editable=False, detailed=False)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    widget.show_item(
+        item=_plan_item("uid1", kwargs={"detectors": ["det1"], "delay": 2})
+    )
+
+    assert widget._params_indices == [0, 2]
+    assert [row[0] for row in _editor_text(table_model)] == ["detectors", "delay"]
+
+    table_model.setData(table_model.index(1, 2), "7")
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det1"], "delay": 7}
+    table_model.setData(table_model.index(1, 1), Qt.Unchecked, Qt.CheckStateRole)
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det1"]}
+
+    widget.detailed = True
+    assert [row[0] for row in _editor_text(table_model)] == [
+        "detectors",
+        "num",
+        "delay",
+    ]
+
+
+def test_plan_editor_parameters_valid(qtbot, re_model):
+    widget = _QtRePlanEditorTable(re_model, editable=True)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    item = _plan_item("uid1", kwargs={"detectors": ["det1"], "num": 5})
+    with qtbot.waitSignal(widget.signal_parameters_valid, timeout=1000) as blocker:
+        widget.show_item(item=item)
+    assert blocker.args == [True]
+
+    with qtbot.waitSignal(widget.signal_parameters_valid, timeout=1000) as blocker:
+        table_model.setData(table_model.index(0, 2), "['det1'")
+    assert blocker.args == [False]
+    assert widget._invalid_rows == {0}
+    assert (
+        table_model.data(table_model.index(0, 2), Qt.ForegroundRole)
+        == widget._text_color_invalid
+    )
+
+    # The signal is emitted only when the validity of the table changes
+    with qtbot.assertNotEmitted(widget.signal_parameters_valid):
+        table_model.setData(table_model.index(1, 2), "5 +")
+        table_model.setData(table_model.index(0, 2), "['det2']")
+    assert widget._invalid_rows == {1}
+
+    # Disabling the parameter with invalid value makes the table valid
+    with qtbot.waitSignal(widget.signal_parameters_valid, timeout=1000) as blocker:
+        table_model.setData(table_model.index(1, 1), Qt.Unchecked, Qt.CheckStateRole)
+    assert blocker.args == [True]
+    assert widget._invalid_rows == set()
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det2"]}
+
+
+def test_plan_editor_show_same_item(qtbot, re_model):
+    widget = _QtRePlanEditorTable(re_model, editable=True)
+    qtbot.addWidget(widget)
+    table_model = widget._table_model
+    item = _plan_item("uid1", kwargs={"detectors": ["det1"]})
+    widget.show_item(item=item)
+
+    # The table is not filled again if nothing changed
+    with qtbot.assertNotEmitted(table_model.dataChanged):
+        widget.show_item(item=item)
+
+    # The table is filled again after the user edited the item
+    table_model.setData(table_model.index(0, 2), "['det2']")
+    widget.show_item(item=item)
+    assert _editor_text(table_model)[0] == ["detectors", "", "['det1']"]
+    assert widget.get_modified_item()["kwargs"] == {"detectors": ["det1"]}
+
+    # ... and after the list of allowed plans is reloaded
+    allowed_plans = copy.deepcopy(_ALLOWED_PLANS)
+    allowed_plans["count"]["parameters"][1]["default"] = "2"
+    re_model._allowed_plans.clear()
+    re_model._allowed_plans.update(allowed_plans)
+    widget.show_item(item=item)
+    assert _editor_text(table_model)[1] == ["num", "", "2 (default)"]
@@ -1,8 +1,11 @@
 import ast
+import functools
 import inspect
-import time
+import itertools
+import logging
 import pprint
-import copy
+import threading
+import weakref
 
 from qtpy.QtWidgets import (
     QWidget,
@@ -11,8 +14,6 @@ from qtpy.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
     QTableView,
     QHeaderView,
     QAbstractItemView,
@@ -24,20 +25,232 @@ from qtpy.QtWidgets import (
     QSizePolicy,
     QLineEdit,
     QCheckBox,
+    QAbstractButton,
 )
-from qtpy.QtCore import Qt, Signal, Slot, QTimer
-from qtpy.QtGui import QFontMetrics, QPalette, QBrush, QColor
+from qtpy.QtCore import (
+    Qt,
+    Signal,
+    Slot,
+    QTimer,
+    QObject,
+    QThread,
+    QCoreApplication,
+    QAbstractTableModel,
+    QModelIndex,
+    QItemSelection,
+    QStringListModel,
+)
+from qtpy.QtGui import QFontMetrics, QPalette, QBrush, QColor, QTextCursor
 
-from bluesky_widgets.qt.threading import FunctionWorker
 from bluesky_queueserver.manager.profile_ops import _construct_parameters
 
+logger = logging.getLogger(__name__)
+
+
+def _text_width(font_metrics, text):
+    """
+    Returns the width of ``text`` in pixels. (``QFontMetrics.width`` is deprecated since Qt 5.11)
+    """
+    if hasattr(font_metrics, "horizontalAdvance"):
+        return font_metrics.horizontalAdvance(text)
+    return font_metrics.width(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _text_to_html(text, *, nindent=4):
+    """
+    Formats text as a sequence indented html lines. Lines are indented by `nindent` spaces.
+    The results are cached, since the same text (e.g. metadata of the running plan) is
+    usually displayed many times.
+    """
+    return "<br>".join(
+        "&nbsp;" * (len(line) - len(line.lstrip(" ")) + nindent) + line.lstrip(" ")
+        for line in text.split("\n")
+    )
+
+
+def _print_value(v):
+    """
+    Formats the value of a plan parameter for displaying in the editor table.
+    """
+    if isinstance(v, str):
+        return f"'{v}'"
+    else:
+        return str(v)
+
+
+class _StatusSnapshot:
+    """
+    Values extracted from the status of RE Manager once per status update and shared
+    by all widgets that display them. ``status`` is the status dictionary and
+    ``connection_state`` is the connection state (None - unknown, True or False), as
+    ``is_connected`` in ``status_changed`` events. ``is_connected`` is True only if
+    RE Manager is known to be online.
+    """
+
+    __slots__ = (
+        "status",
+        "connection_state",
+        "is_connected",
+        "worker_exists",
+        "manager_state",
+        "re_state",
+        "running_item_uid",
+        "queue_stop_pending",
+        "queue_loop_enabled",
+        "items_in_history",
+        "items_in_queue",
+    )
+
+    def __init__(self, status, is_connected):
+        self.status = status
+        self.connection_state = is_connected
+        self.is_connected = bool(is_connected)
+        self.worker_exists = bool(status.get("worker_environment_exists", False))
+        self.manager_state = status.get("manager_state", None)
+        self.re_state = status.get("re_state", None)
+        self.running_item_uid = status.get("running_item_uid", None)
+        self.queue_stop_pending = bool(status.get("queue_stop_pending", False))
+        queue_mode = status.get("plan_queue_mode", None)
+        self.queue_loop_enabled = bool(
+            queue_mode.get("loop", False) if queue_mode else False
+        )
+        self.items_in_history = status.get("items_in_history", None)
+        self.items_in_queue = status.get("items_in_queue", None)
+
+
+class _StatusChangedDispatcher(QObject):
+    """
+    Delivers ``status_changed`` events of the model to the widgets in the GUI thread.
+
+    Status is loaded in a worker thread and every widget displaying it used to receive
+    each event separately. If several events arrive before the GUI thread gets to process
+    them, only the latest is delivered, once, to all connected widgets. The widgets receive
+    ``_StatusSnapshot`` instead of the event.
+    """
+
+    signal_status_changed = Signal(object)
+    _signal_event_pending = Signal()
+
+    def __init__(self, model):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending_event = None
+        self._signal_event_pending.connect(self._slot_event_pending)
+        model.events.status_changed.connect(self._on_status_changed)
+
+    def _on_status_changed(self, event):
+        # This may be called from any thread
+        with self._lock:
+            is_queued = self._pending_event is not None
+            self._pending_event = event
+        if not is_queued:
+            self._signal_event_pending.emit()
+
+    @Slot()
+    def _slot_event_pending(self):
+        with self._lock:
+            event, self._pending_event = self._pending_event, None
+        if event is not None:
+            snapshot = _StatusSnapshot(event.status, event.is_connected)
+            self.signal_status_changed.emit(snapshot)
+
+
+# Key: model, value: the dispatcher of its 'status_changed' events shared by all widgets
+_status_changed_dispatchers = weakref.WeakKeyDictionary()
+
+
+def _connect_status_changed(model, callback):
+    """
+    Connect ``callback`` to the ``status_changed`` events of ``model``. The callback is
+    executed in the GUI thread with ``_StatusSnapshot`` of the status as the argument and
+    the events that arrive in quick succession are coalesced. Must be called from the GUI thread.
+    """
+    try:
+        dispatcher = _status_changed_dispatchers[model]
+    except KeyError:
+        dispatcher = _status_changed_dispatchers[model] = _StatusChangedDispatcher(
+            model
+        )
+    dispatcher.signal_status_changed.connect(callback)
+
+
+class _DeferUpdatesWhileHidden:
+    """
+    Mixin for widgets that skip updates while they are hidden (e.g. placed on an inactive tab).
+    The slots call ``_defer_update`` first and return if it returns True. The latest deferred
+    call of each slot is executed, in the order of the calls, once the widget is shown.
+    The widget must initialize ``self._deferred_updates = {}``.
+    """
+
+    def _defer_update(self, slot, *args):
+        if self.isVisible():
+            return False
+        # Re-insert the key, so that the updates are executed in the order of the latest calls
+        self._deferred_updates.pop(slot.__name__, None)
+        self._deferred_updates[slot.__name__] = (slot, args)
+        return True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        deferred_updates, self._deferred_updates = self._deferred_updates, {}
+        for slot, args in deferred_updates.values():
+            slot(*args)
+
+
+class _CoalesceButtonStateUpdates:
+    """
+    Mixin for widgets that set the states of the buttons in ``_update_button_states``.
+    The slots call ``_schedule_button_states_update`` instead, so the states are updated
+    once after the events that are processed in the same iteration of the event loop
+    (e.g. status update, queue update and selection change). The widget must initialize
+    ``self._button_states_update_pending = False``.
+    """
+
+    def _schedule_button_states_update(self):
+        if not self._button_states_update_pending:
+            self._button_states_update_pending = True
+            QTimer.singleShot(0, self._flush_button_states_update)
+
+    def _flush_button_states_update(self):
+        self._button_states_update_pending = False
+        self._update_button_states()
+
+
+class _StatusPollWorker(QObject):
+    """
+    Loads the status of RE Manager. The object lives in a separate thread, ``poll`` is called
+    via a queued signal and ``finished`` is emitted once the status is loaded.
+    """
 
-class QtReManagerConnection(QWidget):
-    signal_update_widget = Signal(object)
+    finished = Signal()
+
+    def __init__(self, model):
+        super().__init__()
+        self._model = model
+
+    @Slot()
+    def poll(self):
+        try:
+            self._model.load_re_manager_status()
+        except Exception:
+            logger.exception("Failed to load the status of RE Manager")
+        finally:
+            self.finished.emit()
+
+
+def _stop_thread(thread):
+    thread.quit()
+    thread.wait()
+
+
+class QtReManagerConnection(_DeferUpdatesWhileHidden, QWidget):
+    _signal_poll = Signal()
 
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
 
         self._lb_connected = QLabel("OFF")
 
@@ -62,14 +275,32 @@ class QtReManagerConnection(QWidget):
         vbox.addWidget(self._group_box)
         self.setLayout(vbox)
 
-        # Thread used to initiate periodic status updates
-        self._thread = None
+        # Status is polled periodically: the timer requests the worker to load the status,
+        #   unless the previous request is still in progress. The worker thread is started
+        #   on connection and runs until the widget is closed or destroyed or the application quits.
+        self._poll_worker = None
+        self._poll_thread = None
+        self._is_polling = False
         self.updates_activated = False
         self.update_period = 1  # Status update period in seconds
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._poll_status)
+
+        # While the status does not change, the polling period is gradually increased:
+        #   '_n_polls_before_backoff' - the number of polls returning the same status, after
+        #       which the period is doubled with each further unchanged poll;
+        #   '_max_update_period_factor' - the period is at most this many times 'update_period'.
+        #   With the default values, a change made by another client (e.g. a plan started
+        #   from another GUI) is displayed up to 4 s after it is made instead of 1 s. Any
+        #   change of the status, including one caused by a user action in this client (which
+        #   reloads the status immediately), returns the period to 'update_period'.
+        self._n_polls_before_backoff = 5
+        self._max_update_period_factor = 4
+        self._n_unchanged_polls = 0
+        self._last_polled_state = None
 
         self._update_widget_states()
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widget.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
     def _update_widget_states(self):
         self._pb_re_manager_connect.setEnabled(not self.updates_activated)
@@ -78,12 +309,15 @@ class QtReManagerConnection(QWidget):
         # We don't know if the server is online or offline:
         self._lb_connected.setText("-----")
 
-    def on_update_widgets(self, event):
-        is_connected = event.is_connected
-        self.signal_update_widget.emit(is_connected)
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self._reset_poll_backoff()
+        self.slot_update_widgets(snapshot.connection_state)
 
     @Slot(object)
     def slot_update_widgets(self, is_connected):
+        if self._defer_update(self.slot_update_widgets, is_connected):
+            return
         # 'is_connected' may take values None, True and False
         text = "-----"
         if is_connected is True:
@@ -92,39 +326,104 @@ class QtReManagerConnection(QWidget):
             text = "OFFLINE"
         self._lb_connected.setText(text)
 
+    @Slot()
     def _pb_re_manager_connect_clicked(self):
         self.updates_activated = True
         self.model.clear_connection_status()
         self._update_widget_states()
         self.model.manager_connecting_ops()
-        self._start_thread()
+        self._n_unchanged_polls = 0
+        self._last_polled_state = None
+        self._start_poll_thread()
+        self._poll_timer.start(int(self.update_period * 1000))
+        self._poll_status()
 
+    @Slot()
     def _pb_re_manager_disconnect_clicked(self):
         self.updates_activated = False
+        self._poll_timer.stop()
+        # If a request is in progress, the widgets are updated once it is complete
+        if not self._is_polling:
+            self._updates_deactivated()
 
-    def _start_thread(self):
-        self._thread = FunctionWorker(self._reload_status)
-        self._thread.finished.connect(self._reload_complete)
-        self._thread.start()
+    def _updates_deactivated(self):
+        self.model.clear_connection_status()
+        self._update_widget_states()
 
-    def _reload_complete(self):
-        if self.updates_activated:
-            self._start_thread()
-        else:
-            self.model.clear_connection_status()
-            self._update_widget_states()
+    def _start_poll_thread(self):
+        if self._poll_thread is None:
+            self._poll_worker = _StatusPollWorker(self.model)
+            self._poll_thread = QThread(self)
+            self._poll_worker.moveToThread(self._poll_thread)
+            # The connections are queued, since the objects live in different threads
+            self._signal_poll.connect(self._poll_worker.poll)
+            self._poll_worker.finished.connect(self._poll_complete)
+            QCoreApplication.instance().aboutToQuit.connect(self._stop_poll_thread)
+            # The thread is deleted along with the widget and must be stopped first. The slot
+            #   may not reference the widget, which is already partially destroyed.
+            self.destroyed.connect(functools.partial(_stop_thread, self._poll_thread))
+        if not self._poll_thread.isRunning():
+            self._poll_thread.start()
+
+    @Slot()
+    def _stop_poll_thread(self):
+        self._poll_timer.stop()
+        if self._poll_thread is not None:
+            _stop_thread(self._poll_thread)
+        self._is_polling = False
+
+    def closeEvent(self, event):
+        self.updates_activated = False
+        self._stop_poll_thread()
+        self._updates_deactivated()
+        super().closeEvent(event)
+
+    @Slot()
+    def _poll_status(self):
+        if self._is_polling:
+            # Skip this tick: the previous request is still in progress
+            return
+        self._is_polling = True
+        self._signal_poll.emit()
 
-    def _reload_status(self):
-        self.model.load_re_manager_status()
-        time.sleep(self.update_period)
+    def _reset_poll_backoff(self):
+        self._n_unchanged_polls = 0
+        interval = int(self.update_period * 1000)
+        if self._poll_timer.isActive() and self._poll_timer.interval() != interval:
+            self._poll_timer.setInterval(interval)
 
+    @Slot()
+    def _poll_complete(self):
+        self._is_polling = False
+        if not self.updates_activated:
+            self._updates_deactivated()
+            return
+
+        # Back off while the status stays the same, return to the normal period once it changes
+        state = (self.model.re_manager_connected, dict(self.model.re_manager_status))
+        if state == self._last_polled_state:
+            self._n_unchanged_polls += 1
+        else:
+            self._n_unchanged_polls = 0
+        self._last_polled_state = state
 
-class QtReEnvironmentControls(QWidget):
-    signal_update_widget = Signal(bool, object)
+        period = self.update_period
+        if self._n_unchanged_polls >= self._n_polls_before_backoff:
+            n_doublings = self._n_unchanged_polls - self._n_polls_before_backoff + 1
+            factor = min(2**n_doublings, self._max_update_period_factor)
+            period *= factor
+        interval = int(period * 1000)
+        if self._poll_timer.interval() != interval:
+            self._poll_timer.setInterval(interval)
 
+
+class QtReEnvironmentControls(_DeferUpdatesWhileHidden, QWidget):
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
+        # Widget state applied by the last update, the update is skipped if it didn't change
+        self._last_enable_state = None
 
         self._pb_env_open = QPushButton("Open")
         self._pb_env_open.setEnabled(False)
@@ -151,19 +450,25 @@ class QtReEnvironmentControls(QWidget):
         vbox.addWidget(self._group_box)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widget.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
-    def on_update_widgets(self, event):
-        is_connected = bool(event.is_connected)
-        status = event.status
-        self.signal_update_widget.emit(is_connected, status)
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets(snapshot)
+
+    @Slot(object)
+    def slot_update_widgets(self, snapshot):
+        if self._defer_update(self.slot_update_widgets, snapshot):
+            return
+        is_connected = snapshot.is_connected
+        worker_exists = snapshot.worker_exists
+        manager_state = snapshot.manager_state
+
+        state = (is_connected, worker_exists, manager_state)
+        if state == self._last_enable_state:
+            return
+        self._last_enable_state = state
 
-    @Slot(bool, object)
-    def slot_update_widgets(self, is_connected, status):
-        # 'is_connected' takes values True, False
-        worker_exists = status.get("worker_environment_exists", False)
-        manager_state = status.get("manager_state", None)
         self._pb_env_open.setEnabled(
             is_connected and not worker_exists and (manager_state == "idle")
         )
@@ -172,18 +477,21 @@ class QtReEnvironmentControls(QWidget):
         )
         self._pb_env_destroy.setEnabled(is_connected and worker_exists)
 
+    @Slot()
     def _pb_env_open_clicked(self):
         try:
             self.model.environment_open()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_env_close_clicked(self):
         try:
             self.model.environment_close()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_env_destroy_clicked(self):
         try:
             self.model.environment_destroy()
@@ -191,12 +499,13 @@ class QtReEnvironmentControls(QWidget):
             print(f"Exception: {ex}")
 
 
-class QtReQueueControls(QWidget):
-    signal_update_widget = Signal(bool, object)
-
+class QtReQueueControls(_DeferUpdatesWhileHidden, QWidget):
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
+        # Widget state applied by the last update, the update is skipped if it didn't change
+        self._last_enable_state = None
 
         self._lb_queue_state = QLabel("STOPPED")
 
@@ -222,20 +531,30 @@ class QtReQueueControls(QWidget):
         vbox.addWidget(self._group_box)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widget.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
-    def on_update_widgets(self, event):
-        is_connected = bool(event.is_connected)
-        status = event.status
-        self.signal_update_widget.emit(is_connected, status)
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets(snapshot)
 
-    @Slot(bool, object)
-    def slot_update_widgets(self, is_connected, status):
-        # 'is_connected' takes values True, False
-        worker_exists = status.get("worker_environment_exists", False)
-        running_item_uid = status.get("running_item_uid", None)
-        queue_stop_pending = status.get("queue_stop_pending", False)
+    @Slot(object)
+    def slot_update_widgets(self, snapshot):
+        if self._defer_update(self.slot_update_widgets, snapshot):
+            return
+        is_connected = snapshot.is_connected
+        worker_exists = snapshot.worker_exists
+        running_item_uid = snapshot.running_item_uid
+        queue_stop_pending = snapshot.queue_stop_pending
+
+        state = (
+            is_connected,
+            worker_exists,
+            bool(running_item_uid),
+            queue_stop_pending,
+        )
+        if state == self._last_enable_state:
+            return
+        self._last_enable_state = state
 
         s = "RUNNING" if running_item_uid else "STOPPED"
         self._lb_queue_state.setText(s)
@@ -248,13 +567,18 @@ class QtReQueueControls(QWidget):
         )
         self._pb_queue_stop.setChecked(queue_stop_pending)
 
+    @Slot()
     def _pb_queue_start_clicked(self):
         try:
             self.model.queue_start()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_queue_stop_clicked(self):
+        # Clicking changes the 'checked' state of the button. Make sure the next update
+        #   restores it from the status if the request fails.
+        self._last_enable_state = None
         try:
             if self._pb_queue_stop.isChecked():
                 self.model.queue_stop()
@@ -264,12 +588,13 @@ class QtReQueueControls(QWidget):
             print(f"Exception: {ex}")
 
 
-class QtReExecutionControls(QWidget):
-    signal_update_widget = Signal(bool, object)
-
+class QtReExecutionControls(_DeferUpdatesWhileHidden, QWidget):
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
+        # Widget state applied by the last update, the update is skipped if it didn't change
+        self._last_enable_state = None
 
         self._pb_plan_pause_deferred = QPushButton("Pause: Deferred")
         self._pb_plan_pause_deferred.setEnabled(False)
@@ -318,19 +643,25 @@ class QtReExecutionControls(QWidget):
         vbox.addWidget(self._group_box)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widget.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
+
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets(snapshot)
+
+    @Slot(object)
+    def slot_update_widgets(self, snapshot):
+        if self._defer_update(self.slot_update_widgets, snapshot):
+            return
+        is_connected = snapshot.is_connected
+        worker_exists = snapshot.worker_exists
+        manager_state = snapshot.manager_state
 
-    def on_update_widgets(self, event):
-        is_connected = bool(event.is_connected)
-        status = event.status
-        self.signal_update_widget.emit(is_connected, status)
+        state = (is_connected, worker_exists, manager_state)
+        if state == self._last_enable_state:
+            return
+        self._last_enable_state = state
 
-    @Slot(bool, object)
-    def slot_update_widgets(self, is_connected, status):
-        # 'is_connected' takes values True, False
-        worker_exists = status.get("worker_environment_exists", False)
-        manager_state = status.get("manager_state", None)
         self._pb_plan_pause_deferred.setEnabled(
             is_connected and worker_exists and (manager_state == "executing_queue")
         )
@@ -350,36 +681,42 @@ class QtReExecutionControls(QWidget):
             is_connected and worker_exists and (manager_state == "paused")
         )
 
+    @Slot()
     def _pb_plan_pause_deferred_clicked(self):
         try:
             self.model.re_pause(option="deferred")
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_plan_pause_immediate_clicked(self):
         try:
             self.model.re_pause(option="immediate")
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_plan_resume_clicked(self):
         try:
             self.model.re_resume()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_plan_stop_clicked(self):
         try:
             self.model.re_stop()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_plan_abort_clicked(self):
         try:
             self.model.re_abort()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_plan_halt_clicked(self):
         try:
             self.model.re_halt()
@@ -387,12 +724,11 @@ class QtReExecutionControls(QWidget):
             print(f"Exception: {ex}")
 
 
-class QtReStatusMonitor(QWidget):
-    signal_update_widget = Signal(object)
-
+class QtReStatusMonitor(_DeferUpdatesWhileHidden, QWidget):
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
 
         self._lb_environment_exists_text = "RE Environment: "
         self._lb_manager_state_text = "Manager state: "
@@ -438,30 +774,32 @@ class QtReStatusMonitor(QWidget):
         vbox.addWidget(self._group_box)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widget.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
     def _set_label_text(self, label, prefix, value):
         if value is None:
             value = "-"
-        label.setText(f"{prefix}{value}")
-
-    def on_update_widgets(self, event):
-        status = event.status
-        self.signal_update_widget.emit(status)
+        text = f"{prefix}{value}"
+        # 'setText' schedules repainting of the label even if the text is the same
+        if label.text() != text:
+            label.setText(text)
 
     @Slot(object)
-    def slot_update_widgets(self, status):
-        worker_exists = status.get("worker_environment_exists", None)
-        manager_state = status.get("manager_state", None)
-        re_state = status.get("re_state", None)
-        items_in_history = status.get("items_in_history", None)
-        items_in_queue = status.get("items_in_queue", None)
-        queue_is_running = bool(status.get("running_item_uid", False))
-        queue_stop_pending = status.get("queue_stop_pending", None)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets(snapshot)
 
-        queue_mode = status.get("plan_queue_mode", None)
-        queue_loop_enabled = queue_mode.get("loop", None) if queue_mode else None
+    @Slot(object)
+    def slot_update_widgets(self, snapshot):
+        if self._defer_update(self.slot_update_widgets, snapshot):
+            return
+        worker_exists = snapshot.worker_exists
+        manager_state = snapshot.manager_state
+        re_state = snapshot.re_state
+        items_in_history = snapshot.items_in_history
+        items_in_queue = snapshot.items_in_queue
+        queue_is_running = bool(snapshot.running_item_uid)
+        queue_stop_pending = snapshot.queue_stop_pending
+        queue_loop_enabled = snapshot.queue_loop_enabled
 
         # Capitalize state of RE Manager
         manager_state = (
@@ -469,48 +807,210 @@ class QtReStatusMonitor(QWidget):
         )
         re_state = re_state.upper() if isinstance(re_state, str) else re_state
 
-        self._set_label_text(
-            self._lb_environment_exists,
-            self._lb_environment_exists_text,
-            "OPEN" if worker_exists else "CLOSED",
-        )
-        self._set_label_text(
-            self._lb_manager_state, self._lb_manager_state_text, manager_state
-        )
-        self._set_label_text(self._lb_re_state, self._lb_re_state_text, re_state)
-        self._set_label_text(
-            self._lb_items_in_history,
-            self._lb_items_in_history_text,
-            str(items_in_history),
-        )
-        self._set_label_text(
-            self._lb_items_in_queue, self._lb_items_in_queue_text, str(items_in_queue)
-        )
-        self._set_label_text(
-            self._lb_queue_is_running,
-            self._lb_queue_is_running_text,
-            "YES" if queue_is_running else "NO",
-        )
-        self._set_label_text(
-            self._lb_queue_stop_pending,
-            self._lb_queue_stop_pending_text,
-            "YES" if queue_stop_pending else "NO",
+        label_values = (
+            (
+                self._lb_environment_exists,
+                self._lb_environment_exists_text,
+                "OPEN" if worker_exists else "CLOSED",
+            ),
+            (self._lb_manager_state, self._lb_manager_state_text, manager_state),
+            (self._lb_re_state, self._lb_re_state_text, re_state),
+            (
+                self._lb_items_in_history,
+                self._lb_items_in_history_text,
+                str(items_in_history),
+            ),
+            (
+                self._lb_items_in_queue,
+                self._lb_items_in_queue_text,
+                str(items_in_queue),
+            ),
+            (
+                self._lb_queue_is_running,
+                self._lb_queue_is_running_text,
+                "YES" if queue_is_running else "NO",
+            ),
+            (
+                self._lb_queue_stop_pending,
+                self._lb_queue_stop_pending_text,
+                "YES" if queue_stop_pending else "NO",
+            ),
+            (
+                self._lb_queue_loop_mode,
+                self._lb_queue_loop_mode_text,
+                "ON" if queue_loop_enabled else "OFF",
+            ),
         )
 
-        self._set_label_text(
-            self._lb_queue_loop_mode,
-            self._lb_queue_loop_mode_text,
-            "ON" if queue_loop_enabled else "OFF",
+        # Repaint the group of labels once after all the changed labels are updated
+        self.setUpdatesEnabled(False)
+        try:
+            for label, prefix, value in label_values:
+                self._set_label_text(label, prefix, value)
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+class _ReadOnlyTableModel(QAbstractTableModel):
+    """
+    Base class for read-only table models. ``self._rows`` is the list of displayed rows
+    (tuples of column values).
+    """
+
+    # The view calls 'data' for several roles and 'flags' for each painted cell,
+    #   so the values returned for all cells are computed once.
+    _ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, column_labels, parent=None):
+        super().__init__(parent)
+        self._column_labels = tuple(column_labels)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_labels)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._column_labels[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            # Only dropping is allowed on the root item (e.g. below the last row)
+            return self._ITEM_FLAGS & Qt.ItemIsDropEnabled
+        return self._ITEM_FLAGS
+
+
+class _QueueTableModel(_ReadOnlyTableModel):
+    """
+    Read-only table model holding the text displayed in each row (tuple of column values).
+    The rows are replaced by ``set_rows``, which notifies the views only of the rows
+    that were inserted, removed or changed.
+    """
+
+    @property
+    def rows(self):
+        """
+        The list of displayed rows (tuples of column values). Use ``set_rows`` to change.
+        """
+        return self._rows
+
+    # Dragging is enabled/disabled by the view
+    _ITEM_FLAGS = (
+        _ReadOnlyTableModel._ITEM_FLAGS | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
+    )
+
+    def set_rows(self, rows):
+        """
+        Replace the table contents with ``rows`` (list of tuples of column values).
+        """
+        rows = list(rows)
+        n_old, n_new = len(self._rows), len(rows)
+
+        changed = [nr for nr in range(min(n_old, n_new)) if rows[nr] != self._rows[nr]]
+        if changed:
+            self._rows[: min(n_old, n_new)] = rows[: min(n_old, n_new)]
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self._column_labels) - 1),
+            )
+
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows.extend(rows[n_old:])
+            self.endInsertRows()
+        elif n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._rows[n_new:]
+            self.endRemoveRows()
+
+
+class _ItemTableModel(_ReadOnlyTableModel):
+    """
+    Read-only table model displaying a list of items (e.g. plan history items). The text
+    of a row is computed by ``get_row_values(item)`` only when the row is displayed (views
+    request data only for the visible rows) and kept until the items are replaced.
+    """
+
+    def __init__(self, column_labels, get_row_values, parent=None):
+        super().__init__(column_labels, parent)
+        self._get_row_values = get_row_values
+        self._items = []
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        nr = index.row()
+        values = self._rows[nr]
+        if values is None:
+            values = self._get_row_values(self._items[nr])
+            self._rows[nr] = values
+        return values[index.column()]
+
+    def set_items(self, items):
+        """
+        Replace the displayed items. Items are identified by ``item_uid``. If the new list
+        only appends items to the displayed ones (e.g. new items are added to the history),
+        only the new rows are inserted. Otherwise the model is reset.
+        """
+        items = list(items)
+        n_old, n_new = len(self._items), len(items)
+        is_appended = n_new >= n_old and all(
+            old.get("item_uid", None) == new.get("item_uid", None)
+            for old, new in zip(self._items, items)
         )
 
+        if not is_appended:
+            self.beginResetModel()
+            self._items = items
+            self._rows = [None] * n_new
+            self.endResetModel()
+        elif n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._items = items
+            self._rows.extend([None] * (n_new - n_old))
+            self.endInsertRows()
+        else:
+            # Same items: the rows that were already formatted are still valid
+            self._items = items
+
+    def refresh_rows(self):
+        """
+        Discard the formatted rows (e.g. when the formatting of the items changes). The rows
+        are formatted again when they are displayed.
+        """
+        n_items = len(self._items)
+        self._rows = [None] * n_items
+        if n_items:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(n_items - 1, len(self._column_labels) - 1)
+            )
+
+
+class QueueTableView(QTableView):
+    """
+    Table view that supports drag and drop of rows and scrolls while an item is dragged
+    near the top or bottom edge. ``scroll_callback`` is called with the scroll direction
+    (``"up"`` or ``"down"``) on each scroll step.
+    """
 
-class QueueTableWidget(QTableWidget):
     signal_drop_event = Signal(int, int)
-    signal_scroll = Signal(str)
     signal_resized = Signal()
 
-    def __init__(self):
+    def __init__(self, scroll_callback=None):
         super().__init__()
+        # Called directly, the scroll timer runs in the GUI thread
+        self._scroll_callback = scroll_callback
         self._is_mouse_pressed = False
         self._is_scroll_active = False
         self._scroll_direction = ""
@@ -570,8 +1070,10 @@ class QueueTableWidget(QTableWidget):
             self._scroll_direction = ""
             self._scroll_timer.stop()
 
+    @Slot()
     def _on_scroll_timeout(self):
-        self.signal_scroll.emit(self._scroll_direction)
+        if self._scroll_callback is not None:
+            self._scroll_callback(self._scroll_direction)
 
         self._scroll_timer_count += 1
         timeout = (
@@ -587,26 +1089,32 @@ class PushButtonMinimumWidth(QPushButton):
     Push button minimum width necessary to fit the text
     """
 
+    # Button width for each font and text: key - (font key, text), value - width
+    _width_cache = {}
+
     def __init__(self, *args, **kwargs):
 
         super().__init__(*args, **kwargs)
         text = self.text()
         font = self.font()
 
-        fm = QFontMetrics(font)
-        text_width = fm.width(text) + 6
+        key = (font.key(), text)
+        text_width = self._width_cache.get(key)
+        if text_width is None:
+            text_width = _text_width(QFontMetrics(font), text) + 6
+            self._width_cache[key] = text_width
         self.setFixedWidth(text_width)
 
 
-class QtRePlanQueue(QWidget):
+class QtRePlanQueue(_CoalesceButtonStateUpdates, _DeferUpdatesWhileHidden, QWidget):
 
-    signal_update_widgets = Signal(bool)
     signal_update_selection = Signal(str)
     signal_plan_queue_changed = Signal(object, str)
 
     def __init__(self, model, parent=None):
         super().__init__(parent)
         self.model = model
+        self._deferred_updates = {}
 
         self._table_column_labels = (
             "",
@@ -615,16 +1123,21 @@ class QtRePlanQueue(QWidget):
             "USER",
             "GROUP",
         )
-        self._table = QueueTableWidget()
-        self._table.setColumnCount(len(self._table_column_labels))
+        # Functions that compute the column values of an item (the labels are resolved only once)
+        self._column_value_getters = tuple(
+            self.model.make_value_getter(label) for label in self._table_column_labels
+        )
+        # The model holds the text displayed in the table, the view formats only the visible rows
+        self._table_model = _QueueTableModel(self._table_column_labels, parent=self)
+        self._table = QueueTableView(scroll_callback=self.on_table_scroll_event)
+        self._table.setModel(self._table_model)
         # self._table.verticalHeader().hide()
-        self._table.setHorizontalHeaderLabels(self._table_column_labels)
         self._table.horizontalHeader().setSectionsMovable(True)
 
         self._table.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
 
         self._table.setSelectionBehavior(QTableView.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SingleSelection)
+        self._table.setSelectionMode(QTableView.SingleSelection)
         self._table.setDragEnabled(False)
         self._table.setAcceptDrops(False)
         self._table.setDropIndicatorShown(True)
@@ -639,10 +1152,21 @@ class QtRePlanQueue(QWidget):
 
         self._table_scrolled_to_bottom = False
 
+        # Column values computed for each queue item: key - item UID, value - (item, values).
+        #   Formatting parameters requires binding them to the plan signature, which is
+        #   expensive, so it is done again only if the item changed.
+        self._row_values_cache = {}
+
         # The following parameters are used only to control widget state (e.g. activate/deactivate
         #   buttons), not to perform real operations.
         self._n_table_items = 0  # The number of items in the table
         self._n_selected_item = -1  # Selected item (table row)
+        # True while the rows or the selection of the table are changed by the widget (not by the user)
+        self._ignore_selection_changes = False
+        # Status values from the latest status update
+        self._status_snapshot = _StatusSnapshot(
+            self.model.re_manager_status, self.model.re_manager_connected
+        )
 
         self._pb_move_up = PushButtonMinimumWidth("Move Up")
         self._pb_move_down = PushButtonMinimumWidth("Down")
@@ -686,8 +1210,7 @@ class QtRePlanQueue(QWidget):
         vbox.addWidget(self._table)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widgets.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
         self.model.events.plan_queue_changed.connect(self.on_plan_queue_changed)
         self.signal_plan_queue_changed.connect(self.slot_plan_queue_changed)
@@ -697,10 +1220,14 @@ class QtRePlanQueue(QWidget):
         )
         self.signal_update_selection.connect(self.slot_change_selection)
 
+        # Formatted parameters depend on the plan signatures
+        self.model.events.allowed_plans_changed.connect(self.on_allowed_plans_changed)
+
         self._table.signal_drop_event.connect(self.on_table_drop_event)
-        self._table.signal_scroll.connect(self.on_table_scroll_event)
 
-        self._table.itemSelectionChanged.connect(self.on_item_selection_changed)
+        self._table.selectionModel().selectionChanged.connect(
+            self.on_item_selection_changed
+        )
         self._table.verticalScrollBar().valueChanged.connect(
             self.on_vertical_scrollbar_value_changed
         )
@@ -708,25 +1235,27 @@ class QtRePlanQueue(QWidget):
             self.on_vertical_scrollbar_range_changed
         )
 
+        self._button_states_update_pending = False
         self._update_button_states()
 
-    def on_update_widgets(self, event):
-        # None should be converted to False:
-        is_connected = bool(event.is_connected)
-        self.signal_update_widgets.emit(is_connected)
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self._status_snapshot = snapshot
+        self.slot_update_widgets(snapshot.is_connected)
 
     @Slot(bool)
     def slot_update_widgets(self, is_connected):
+        if self._defer_update(self.slot_update_widgets, is_connected):
+            return
         # Disable drops if there is no connection to RE Manager
         self._table.setDragEnabled(is_connected)
         self._table.setAcceptDrops(is_connected)
 
-        self._update_button_states()
+        self._schedule_button_states_update()
 
     def _update_button_states(self):
-        is_connected = bool(self.model.re_manager_connected)
-        status = self.model.re_manager_status
-        loop_mode_on = status["plan_queue_mode"]["loop"] if status else False
+        is_connected = self._status_snapshot.is_connected
+        loop_mode_on = self._status_snapshot.queue_loop_enabled
 
         n_items = self._n_table_items
         n_selected_item = self._n_selected_item
@@ -749,14 +1278,17 @@ class QtRePlanQueue(QWidget):
         self._pb_delete_plan.setEnabled(is_connected and is_sel)
         self._pb_duplicate_plan.setEnabled(is_connected and is_sel)
 
+    @Slot(int)
     def on_vertical_scrollbar_value_changed(self, value):
         max = self._table.verticalScrollBar().maximum()
         self._table_scrolled_to_bottom = value == max
 
+    @Slot(int, int)
     def on_vertical_scrollbar_range_changed(self, min, max):
         if self._table_scrolled_to_bottom:
             self._table.verticalScrollBar().setValue(max)
 
+    @Slot(int, int)
     def on_table_drop_event(self, row, col):
         # If the selected queue item is not in the table anymore (e.g. sent to execution),
         #   then ignore the drop event, since the item can not be moved.
@@ -767,11 +1299,12 @@ class QtRePlanQueue(QWidget):
             except Exception as ex:
                 print(f"Exception: {ex}")
 
-        self._update_button_states()
+        self._schedule_button_states_update()
 
     def on_table_scroll_event(self, scroll_direction):
-        v = self._table.verticalScrollBar().value()
-        v_max = self._table.verticalScrollBar().maximum()
+        scroll_bar = self._table.verticalScrollBar()
+        v = scroll_bar.value()
+        v_max = scroll_bar.maximum()
         if scroll_direction == "up" and v > 0:
             v_new = v - 1
         elif scroll_direction == "down" and v < v_max:
@@ -779,7 +1312,7 @@ class QtRePlanQueue(QWidget):
         else:
             v_new = v
         if v != v_new:
-            self._table.verticalScrollBar().setValue(v_new)
+            scroll_bar.setValue(v_new)
 
     def on_plan_queue_changed(self, event):
         plan_queue_items = event.plan_queue_items
@@ -788,65 +1321,95 @@ class QtRePlanQueue(QWidget):
 
     @Slot(object, str)
     def slot_plan_queue_changed(self, plan_queue_items, selected_item_uid):
+        if self._defer_update(
+            self.slot_plan_queue_changed, plan_queue_items, selected_item_uid
+        ):
+            return
 
         # Check if the vertical scroll bar is scrolled to the bottom. Ignore the case
         #   when 'scroll_value==0': if the top plan is visible, it should remain visible
         #   even if additional plans are added to the queue.
-        scroll_value = self._table.verticalScrollBar().value()
-        scroll_maximum = self._table.verticalScrollBar().maximum()
+        scroll_bar = self._table.verticalScrollBar()
+        scroll_value = scroll_bar.value()
+        scroll_maximum = scroll_bar.maximum()
         self._table_scrolled_to_bottom = scroll_value and (
             scroll_value == scroll_maximum
         )
 
-        self._table.clearContents()
-        self._table.setRowCount(len(plan_queue_items))
-
-        if len(plan_queue_items):
-            resize_mode = QHeaderView.ResizeToContents
-        else:
+        cache, new_cache = self._row_values_cache, {}
+        self._row_values_cache = new_cache
+        row_values = []
+        for item in plan_queue_items:
+            item_uid = item.get("item_uid", None)
+            cached_item, values = cache.get(item_uid, (None, None))
+            if values is None or not (cached_item is item or cached_item == item):
+                values = self._queue_item_row_values(item)
+            if item_uid:
+                # Only the items that are still in the queue are kept in the cache
+                new_cache[item_uid] = (item, values)
+            row_values.append(values)
+
+        if not row_values:
             # Empty table, stretch the header
             resize_mode = QHeaderView.Stretch
-        self._table.horizontalHeader().setSectionResizeMode(resize_mode)
-
-        for nr, item in enumerate(plan_queue_items):
-            for nc, col_name in enumerate(self._table_column_labels):
-                try:
-                    value = self.model.get_item_value_for_label(
-                        item=item, label=col_name
-                    )
-                except KeyError:
-                    value = ""
-                table_item = QTableWidgetItem(value)
-                table_item.setFlags(table_item.flags() & ~Qt.ItemIsEditable)
-                self._table.setItem(nr, nc, table_item)
+        elif set(row_values) != set(self._table_model.rows):
+            resize_mode = QHeaderView.ResizeToContents
+        else:
+            # The rows were only rearranged (e.g. an item was moved), so the column widths
+            #   remain the same. Resizing columns to contents requires the size of every cell.
+            resize_mode = QHeaderView.Fixed
+        header = self._table.horizontalHeader()
+        if header.sectionResizeMode(0) != resize_mode:
+            header.setSectionResizeMode(resize_mode)
+
+        # Only the rows that changed are reported to the view, so reloading a long queue
+        #   after a small change (e.g. one item was moved or added) repaints only those rows.
+        #   Removing the selected row changes the selection in the table. It is not a selection
+        #   made by the user and should not be passed to the model: the selection is restored
+        #   from 'selected_item_uid' below. (The signals of the selection model are not blocked,
+        #   since the view also uses them to repaint the selection.)
+        self._ignore_selection_changes = True
+        try:
+            self._table_model.set_rows(row_values)
+        finally:
+            self._ignore_selection_changes = False
 
         # Update the number of table items
         self._n_table_items = len(plan_queue_items)
 
-        # Advance scrollbar if the table is scrolled all the way down.
-        if self._table_scrolled_to_bottom:
-            scroll_maximum_new = self._table.verticalScrollBar().maximum()
-            self._table.verticalScrollBar().setValue(scroll_maximum_new)
+        # The view updates the scroll bar range after the rows are laid out, which happens
+        #   once for all the changes made above. The scroll bar is then advanced in
+        #   'on_vertical_scrollbar_range_changed' if the table is scrolled all the way down.
 
+        # Also updates the button states
         self.slot_change_selection(selected_item_uid)
-        self._update_button_states()
 
-    def on_item_selection_changed(self):
+    def on_allowed_plans_changed(self, event):
+        # Replace (not clear) the cache, since the slot may be using it in the other thread
+        self._row_values_cache = {}
+
+    def _queue_item_row_values(self, item):
+        """
+        Returns the tuple of strings displayed in the table columns for the queue item.
+        """
+        return tuple(getter(item) for getter in self._column_value_getters)
+
+    @Slot(QItemSelection, QItemSelection)
+    def on_item_selection_changed(self, *args):
         """
-        The handler for ``item_selection_changed`` signal emitted by QTableWidget
+        The handler for ``selectionChanged`` signal emitted by the selection model of the table
         """
+        if self._ignore_selection_changes:
+            return
         sel_rows = self._table.selectionModel().selectedRows()
         # It is assumed that only one row may be selected at a time. If the table settings change
         #   so that more than one row could be selected at a time, the following code will not work.
-        try:
-            if len(sel_rows) >= 1:
-                row = sel_rows[0].row()
-                selected_item_uid = self.model.queue_item_pos_to_uid(row)
-                self.model.selected_queue_item_uid = selected_item_uid
-                self._n_selected_item = row
-            else:
-                raise Exception()
-        except Exception:
+        if sel_rows:
+            row = sel_rows[0].row()
+            selected_item_uid = self.model.queue_item_pos_to_uid(row)
+            self.model.selected_queue_item_uid = selected_item_uid
+            self._n_selected_item = row
+        else:
             self.model.selected_queue_item_uid = ""
             self._n_selected_item = -1
 
@@ -859,57 +1422,78 @@ class QtRePlanQueue(QWidget):
 
     @Slot(str)
     def slot_change_selection(self, selected_item_uid):
+        if self._defer_update(self.slot_change_selection, selected_item_uid):
+            return
         row = -1
         if selected_item_uid:
             row = self.model.queue_item_uid_to_pos(selected_item_uid)
+
+        # The selection is set from the model, so 'on_item_selection_changed' does not need
+        #   to pass it back to the model. The model is only updated if the item is not found.
+        self._ignore_selection_changes = True
+        try:
+            if row < 0:
+                self._table.clearSelection()
+            else:
+                self._table.selectRow(row)
+        finally:
+            self._ignore_selection_changes = False
+
         if row < 0:
-            self._table.clearSelection()
             self._n_selected_item = -1
+            self.model.selected_queue_item_uid = ""
         else:
-            self._table.selectRow(row)
             self._n_selected_item = row
 
-        self._update_button_states()
+        self._schedule_button_states_update()
 
+    @Slot()
     def _pb_move_up_clicked(self):
         try:
             self.model.queue_item_move_up()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_move_down_clicked(self):
         try:
             self.model.queue_item_move_down()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_move_to_top_clicked(self):
         try:
             self.model.queue_item_move_to_top()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_move_to_bottom_clicked(self):
         try:
             self.model.queue_item_move_to_bottom()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_delete_plan_clicked(self):
         try:
             self.model.queue_item_remove()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_clear_queue_clicked(self):
         try:
             self.model.queue_clear()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_deselect_clicked(self):
         self._table.clearSelection()
 
+    @Slot()
     def _pb_loop_on_clicked(self):
         loop_enable = self._pb_loop_on.isChecked()
         try:
@@ -917,6 +1501,7 @@ class QtRePlanQueue(QWidget):
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_duplicate_plan_clicked(self):
         try:
             self.model.queue_item_copy_to_queue()
@@ -924,10 +1509,10 @@ class QtRePlanQueue(QWidget):
             print(f"Exception: {ex}")
 
 
-class QtRePlanHistory(QWidget):
-    signal_update_widgets = Signal()
+class QtRePlanHistory(_CoalesceButtonStateUpdates, QWidget):
     signal_update_selection = Signal(int)
     signal_plan_history_changed = Signal(object, int)
+    signal_allowed_plans_changed = Signal()
 
     def __init__(self, model, parent=None):
         super().__init__(parent)
@@ -941,17 +1526,24 @@ class QtRePlanHistory(QWidget):
             "USER",
             "GROUP",
         )
-        self._table = QueueTableWidget()
-        self._table.setColumnCount(len(self._table_column_labels))
+        # Functions that compute the column values of an item (the labels are resolved only once)
+        self._column_value_getters = tuple(
+            self.model.make_value_getter(label) for label in self._table_column_labels
+        )
+        # The text of a row is formatted only when the row is displayed
+        self._table_model = _ItemTableModel(
+            self._table_column_labels, self._history_item_row_values, parent=self
+        )
+        self._table = QTableView()
+        self._table.setModel(self._table_model)
         # self._table.verticalHeader().hide()
-        self._table.setHorizontalHeaderLabels(self._table_column_labels)
         self._table.horizontalHeader().setSectionsMovable(True)
 
         # self._table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self._table.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
 
         self._table.setSelectionBehavior(QTableView.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SingleSelection)
+        self._table.setSelectionMode(QTableView.SingleSelection)
         self._table.setShowGrid(True)
         self._table.setAlternatingRowColors(True)
 
@@ -960,13 +1552,28 @@ class QtRePlanHistory(QWidget):
         self._table.horizontalHeader().setStretchLastSection(True)
         self._table.horizontalHeader().setMinimumSectionSize(5)
 
-        self._table_scrolled_to_bottom = False
+        # The empty table is scrolled to the bottom: the new items remain visible
+        self._table_scrolled_to_bottom = True
         # self._table_slider_is_pressed = False
 
+        # Column values computed for the history items: key - item UID, value - (item, values).
+        #   History items are not changed once added, so the rows are formatted again only
+        #   for new items. UIDs may be repeated in the history, so the items are also compared.
+        self._row_values_cache = {}
+        # The number of the most recent history items used to estimate the column widths
+        self._n_items_column_widths = 50
+        # The column widths are estimated when the first items are added to the empty table
+        #   or when the formatting of the items changes. Otherwise the widths set by the user
+        #   are kept.
+        self._column_widths_outdated = True
+
         # The following parameters are used only to control widget state (e.g. activate/deactivate
         #   buttons), not to perform real operations.
         self._n_table_items = 0  # The number of items in the table
         self._n_selected_item = -1  # Selected item (table row)
+        self._displayed_item_uids = ()  # UIDs of the items displayed in the table
+        # True while the selection of the table is changed by the widget (not by the user)
+        self._ignore_selection_changes = False
 
         self._pb_copy_to_queue = PushButtonMinimumWidth("Copy to Queue")
         self._pb_deselect_all = PushButtonMinimumWidth("Deselect All")
@@ -988,8 +1595,7 @@ class QtRePlanHistory(QWidget):
         vbox.addWidget(self._table)
         self.setLayout(vbox)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widgets.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
         self.model.events.plan_history_changed.connect(self.on_plan_history_changed)
         self.signal_plan_history_changed.connect(self.slot_plan_history_changed)
@@ -999,7 +1605,13 @@ class QtRePlanHistory(QWidget):
         )
         self.signal_update_selection.connect(self.slot_change_selection)
 
-        self._table.itemSelectionChanged.connect(self.on_item_selection_changed)
+        # Formatted parameters depend on the plan signatures
+        self.model.events.allowed_plans_changed.connect(self.on_allowed_plans_changed)
+        self.signal_allowed_plans_changed.connect(self.slot_allowed_plans_changed)
+
+        self._table.selectionModel().selectionChanged.connect(
+            self.on_item_selection_changed
+        )
         self._table.verticalScrollBar().valueChanged.connect(
             self.on_vertical_scrollbar_value_changed
         )
@@ -1007,22 +1619,26 @@ class QtRePlanHistory(QWidget):
             self.on_vertical_scrollbar_range_changed
         )
 
+        self._button_states_update_pending = False
         self._update_button_states()
 
+    @Slot(int)
     def on_vertical_scrollbar_value_changed(self, value):
         max = self._table.verticalScrollBar().maximum()
         self._table_scrolled_to_bottom = value == max
 
+    @Slot(int, int)
     def on_vertical_scrollbar_range_changed(self, min, max):
         if self._table_scrolled_to_bottom:
             self._table.verticalScrollBar().setValue(max)
 
-    def on_update_widgets(self, event):
-        self.signal_update_widgets.emit()
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets()
 
     @Slot()
     def slot_update_widgets(self):
-        self._update_button_states()
+        self._schedule_button_states_update()
 
     def _update_button_states(self):
         is_connected = bool(self.model.re_manager_connected)
@@ -1042,61 +1658,112 @@ class QtRePlanHistory(QWidget):
 
     @Slot(object, int)
     def slot_plan_history_changed(self, plan_history_items, selected_item_pos):
-        # Check if the vertical scroll bar is scrolled to the bottom.
-        scroll_value = self._table.verticalScrollBar().value()
-        scroll_maximum = self._table.verticalScrollBar().maximum()
-        self._table_scrolled_to_bottom = scroll_value == scroll_maximum
-
-        self._table.clearContents()
-        self._table.setRowCount(len(plan_history_items))
+        # Items in the history are not modified, so nothing needs to be updated if the history
+        #   contains the same items (UIDs) and the selection did not change.
+        item_uids = tuple(item.get("item_uid", None) for item in plan_history_items)
+        if (item_uids == self._displayed_item_uids) and (
+            selected_item_pos == self._n_selected_item
+        ):
+            return
+        self._displayed_item_uids = item_uids
 
+        # 'ResizeToContents' mode would format and measure every row of the history. Instead
+        #   the column widths are estimated from the most recent items.
         if len(plan_history_items):
-            resize_mode = QHeaderView.ResizeToContents
+            resize_mode = QHeaderView.Interactive
         else:
             # Empty table, stretch the header
             resize_mode = QHeaderView.Stretch
-        self._table.horizontalHeader().setSectionResizeMode(resize_mode)
-
-        for nr, item in enumerate(plan_history_items):
-            for nc, col_name in enumerate(self._table_column_labels):
-                try:
-                    value = self.model.get_item_value_for_label(
-                        item=item, label=col_name
-                    )
-                except KeyError:
-                    value = ""
-                table_item = QTableWidgetItem(value)
-                table_item.setFlags(table_item.flags() & ~Qt.ItemIsEditable)
-                self._table.setItem(nr, nc, table_item)
+        header = self._table.horizontalHeader()
+        if header.sectionResizeMode(0) != resize_mode:
+            header.setSectionResizeMode(resize_mode)
+
+        # Keep cached values only for the items that are still in the history
+        item_uids = set(item_uids)
+        self._row_values_cache = {
+            uid: v for uid, v in self._row_values_cache.items() if uid in item_uids
+        }
+        self._table_model.set_items(plan_history_items)
+        if not len(plan_history_items):
+            self._column_widths_outdated = True
+        elif self._column_widths_outdated:
+            n_first = max(len(plan_history_items) - self._n_items_column_widths, 0)
+            widths = self._estimate_column_widths(plan_history_items[n_first:])
+            for n, width in enumerate(widths):
+                header.resizeSection(n, width)
+            self._column_widths_outdated = False
 
         # Update the number of table items
         self._n_table_items = len(plan_history_items)
 
-        # Advance scrollbar if the table is scrolled all the way down.
-        if self._table_scrolled_to_bottom:
-            scroll_maximum_new = self._table.verticalScrollBar().maximum()
-            self._table.verticalScrollBar().setValue(scroll_maximum_new)
+        # The scroll bar is not accessed here: its range is updated after the new rows are
+        #   laid out and the scroll bar is then advanced in 'on_vertical_scrollbar_range_changed'
+        #   if the table is scrolled all the way down ('_table_scrolled_to_bottom' is maintained
+        #   by 'on_vertical_scrollbar_value_changed').
 
         # Call function directly
         self.slot_change_selection(selected_item_pos)
 
-        self._update_button_states()
+        self._schedule_button_states_update()
+
+    def on_allowed_plans_changed(self, event):
+        self.signal_allowed_plans_changed.emit()
 
-    def on_item_selection_changed(self):
+    @Slot()
+    def slot_allowed_plans_changed(self):
+        # Parameters of the items are formatted based on the plan signatures, so all rows
+        #   are formatted again. The next history update is processed even if the items
+        #   did not change and the column widths are estimated again.
+        self._row_values_cache = {}
+        self._table_model.refresh_rows()
+        self._displayed_item_uids = ()
+        self._column_widths_outdated = True
+
+    def _estimate_column_widths(self, items):
         """
-        The handler for ``item_selection_changed`` signal emitted by QTableWidget
+        Returns the list of column widths sufficient to display the column labels and
+        the values of ``items``.
         """
+        fm = self._table.fontMetrics()
+        fm_header = self._table.horizontalHeader().fontMetrics()
+        padding = 2 * fm.averageCharWidth()
+        widths = [
+            _text_width(fm_header, label) + padding
+            for label in self._table_column_labels
+        ]
+        for item in items:
+            for n, value in enumerate(self._history_item_row_values(item)):
+                widths[n] = max(widths[n], _text_width(fm, value) + padding)
+        return widths
+
+    def _history_item_row_values(self, item):
+        """
+        Returns the tuple of strings displayed in the table columns for the history item.
+        """
+        item_uid = item.get("item_uid", None)
+        cache = self._row_values_cache
+        cached_item, values = cache.get(item_uid, (None, None))
+        if values is None or not (cached_item is item or cached_item == item):
+            values = tuple(getter(item) for getter in self._column_value_getters)
+            if item_uid:
+                cache[item_uid] = (item, values)
+        return values
+
+    @Slot(QItemSelection, QItemSelection)
+    def on_item_selection_changed(self, *args):
+        """
+        The handler for ``selectionChanged`` signal emitted by the selection model of the table
+        """
+        if self._ignore_selection_changes:
+            return
         sel_rows = self._table.selectionModel().selectedRows()
         # It is assumed that only one row may be selected at a time. If the table settings change
         #   so that more than one row could be selected at a time, the following code will not work.
-        try:
-            if len(sel_rows) >= 1:
-                selected_item_pos = sel_rows[0].row()
-                self.model.selected_history_item_pos = selected_item_pos
-                self._n_selected_item = selected_item_pos
-            else:
-                raise Exception()
-        except Exception:
+        if sel_rows:
+            selected_item_pos = sel_rows[0].row()
+            self.model.selected_history_item_pos = selected_item_pos
+            self._n_selected_item = selected_item_pos
+        else:
             self.model.selected_history_item_pos = -1
             self._n_selected_item = -1
 
@@ -1111,26 +1778,36 @@ class QtRePlanHistory(QWidget):
     def slot_change_selection(self, selected_item_pos):
         row = selected_item_pos
 
-        if row < 0:
-            self._table.clearSelection()
-            self._n_selected_item = -1
-        else:
-            self._table.selectRow(row)
-            self._n_selected_item = row
+        # The selection is set from the model, so 'on_item_selection_changed' does not need
+        #   to pass it back to the model.
+        self._ignore_selection_changes = True
+        try:
+            if row < 0:
+                self._table.clearSelection()
+            else:
+                self._table.selectRow(row)
+        finally:
+            self._ignore_selection_changes = False
 
-        self._update_button_states()
+        self._n_selected_item = row if row >= 0 else -1
+        self.model.selected_history_item_pos = self._n_selected_item
+
+        self._schedule_button_states_update()
 
+    @Slot()
     def _pb_copy_to_queue_clicked(self):
         try:
             self.model.history_item_add_to_queue()
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_deselect_all_clicked(self):
         self._table.clearSelection()
         self._n_selected_item = -1
-        self._update_button_states()
+        self._schedule_button_states_update()
 
+    @Slot()
     def _pb_clear_history_clicked(self):
         try:
             self.model.history_clear()
@@ -1138,8 +1815,7 @@ class QtRePlanHistory(QWidget):
             print(f"Exception: {ex}")
 
 
-class QtReRunningPlan(QWidget):
-    signal_update_widgets = Signal()
+class QtReRunningPlan(_CoalesceButtonStateUpdates, QWidget):
     signal_running_item_changed = Signal(object, object)
 
     def __init__(self, model, parent=None):
@@ -1167,13 +1843,25 @@ class QtReRunningPlan(QWidget):
 
         self._is_item_running = False
         self._running_item_uid = ""
+        # The displayed HTML: the running item and the list of run list lines. The text is
+        #   appended to the document if only new runs were added to the list.
+        self._displayed_running_item_html = ""
+        self._displayed_run_list_parts = []
+        self._button_states_update_pending = False
         self._update_button_states()
 
+        # Running item changes that arrive within the delay are displayed once (only the latest)
+        self._pending_running_item = None
+        self._pending_run_list = None
+        self._running_item_update_delay = 50  # ms
+        self._running_item_timer = QTimer(self)
+        self._running_item_timer.setSingleShot(True)
+        self._running_item_timer.timeout.connect(self._flush_running_item_update)
+
         self.model.events.running_item_changed.connect(self.on_running_item_changed)
         self.signal_running_item_changed.connect(self.slot_running_item_changed)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widgets.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
     def on_running_item_changed(self, event):
         running_item = event.running_item
@@ -1182,57 +1870,56 @@ class QtReRunningPlan(QWidget):
 
     @Slot(object, object)
     def slot_running_item_changed(self, running_item, run_list):
+        self._pending_running_item = running_item
+        self._pending_run_list = run_list
+        if not self._running_item_timer.isActive():
+            self._running_item_timer.start(self._running_item_update_delay)
 
+    @Slot()
+    def _flush_running_item_update(self):
+        running_item, run_list = self._pending_running_item, self._pending_run_list
+        self._pending_running_item, self._pending_run_list = None, None
+        if running_item is not None:
+            self._show_running_item(running_item, run_list)
+
+    def _show_running_item(self, running_item, run_list):
         running_item_uid = running_item.get("item_uid", "")
         is_new_item = running_item_uid != self._running_item_uid
         self._running_item_uid = running_item_uid
 
-        s_running_item = ""
+        running_item_parts = []
         indent = "&nbsp;&nbsp;&nbsp;&nbsp;"
 
-        def _to_html(text, *, nindent=4):
-            """Formats text as a sequence indented html lines. Lines are indented by `nindent` spaces"""
-            lines = text.split("\n")
-            lines_modified = []
-            for line in lines:
-                line_no_leading_spaces = line.lstrip(" ")
-                n_leading_spaces = len(line) - len(line_no_leading_spaces)
-                lines_modified.append(
-                    "&nbsp;" * (n_leading_spaces + nindent) + line_no_leading_spaces
-                )
-            text_modified = "<br>".join(lines_modified)
-
-            return text_modified
-
         if running_item:
-            s_running_item += f"<b>Plan Name:</b> {running_item.get('name', '')}<br>"
+            running_item_parts.append(
+                f"<b>Plan Name:</b> {running_item.get('name', '')}<br>"
+            )
             if ("args" in running_item) and running_item["args"]:
-                s_running_item += (
+                running_item_parts.append(
                     f"<b>Arguments:</b> {str(running_item['args'])[1:-1]}<br>"
                 )
             if ("kwargs" in running_item) and running_item["kwargs"]:
-                s_running_item += "<b>Parameters:</b><br>"
+                running_item_parts.append("<b>Parameters:</b><br>")
                 for k, v in running_item["kwargs"].items():
-                    s_running_item += indent + f"<b>{k}:</b> {v}<br>"
+                    running_item_parts.append(f"{indent}<b>{k}:</b> {v}<br>")
 
             if ("meta" in running_item) and running_item["meta"]:
                 # This representation of metadata may not be the best, but it is still reasonable.
                 #   Note, that metadata may be a dictionary or a list of dictionaries.
                 s_meta = pprint.pformat(running_item["meta"])
-                s_meta = _to_html(s_meta)
-                s_running_item += f"<b>Metadata:</b><br>{s_meta}<br>"
+                s_meta = _text_to_html(s_meta)
+                running_item_parts.append(f"<b>Metadata:</b><br>{s_meta}<br>")
 
-        s_run_list = "<b>Runs:</b><br>" if run_list else ""
+        run_list_parts = ["<b>Runs:</b><br>"] if run_list else []
         for run_info in run_list:
             run_uid = run_info["uid"]
             run_is_open = run_info["is_open"]
             run_exit_status = run_info["exit_status"]
-            s_run = indent + f"{run_uid}  "
             if run_is_open:
-                s_run += "In progress ..."
+                s_status = "In progress ..."
             else:
-                s_run += f"Exit status: {run_exit_status}"
-            s_run_list += s_run + "<br>"
+                s_status = f"Exit status: {run_exit_status}"
+            run_list_parts.append(f"{indent}{run_uid}  {s_status}<br>")
 
         # The following logic is implemented:
         #   - always scroll to the top of the edit box when the new plan is started.
@@ -1244,21 +1931,37 @@ class QtReRunningPlan(QWidget):
         scroll_maximum = self._text_edit.verticalScrollBar().maximum()
         tb_scrolled_to_bottom = scroll_value and (scroll_value == scroll_maximum)
 
-        self._text_edit.setHtml(s_running_item + s_run_list)
+        running_item_html = "".join(running_item_parts)
+        n_displayed = len(self._displayed_run_list_parts)
+        if (
+            not is_new_item
+            and (running_item_html == self._displayed_running_item_html)
+            and (len(run_list_parts) > n_displayed)
+            and (run_list_parts[:n_displayed] == self._displayed_run_list_parts)
+        ):
+            # Only new runs were added: append them without laying out the existing text
+            cursor = QTextCursor(self._text_edit.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertHtml("".join(run_list_parts[n_displayed:]))
+        else:
+            self._text_edit.setHtml(running_item_html + "".join(run_list_parts))
+        self._displayed_running_item_html = running_item_html
+        self._displayed_run_list_parts = run_list_parts
 
         self._is_item_running = bool(running_item)
-        self._update_button_states()
+        self._schedule_button_states_update()
 
         scroll_maximum_new = self._text_edit.verticalScrollBar().maximum()
         scroll_value_new = scroll_maximum_new if tb_scrolled_to_bottom else scroll_value
         self._text_edit.verticalScrollBar().setValue(scroll_value_new)
 
-    def on_update_widgets(self, event):
-        self.signal_update_widgets.emit()
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets()
 
     @Slot()
     def slot_update_widgets(self):
-        self._update_button_states()
+        self._schedule_button_states_update()
 
     def _update_button_states(self):
         is_connected = bool(self.model.re_manager_connected)
@@ -1266,6 +1969,7 @@ class QtReRunningPlan(QWidget):
 
         self._pb_copy_to_queue.setEnabled(is_connected and is_plan_running)
 
+    @Slot()
     def _pb_copy_to_queue_clicked(self):
         try:
             self.model.running_item_add_to_queue()
@@ -1327,35 +2031,201 @@ class LineEditResized(QLineEdit):
         return hint
 
 
-class _QtRePlanEditorTable(QTableWidget):
+class _EditorTableCell:
+    """
+    Contents of a cell of the plan editor table. ``check_state`` is None if the cell
+    has no check box, ``foreground`` is None if the text is displayed using the default color.
+    """
+
+    __slots__ = ("text", "tooltip", "flags", "check_state", "foreground")
+
+    def __init__(
+        self,
+        text="",
+        *,
+        tooltip=None,
+        flags=Qt.ItemIsSelectable | Qt.ItemIsEnabled,
+        check_state=None,
+        foreground=None,
+    ):
+        self.text = text
+        self.tooltip = tooltip
+        self.flags = flags
+        self.check_state = check_state
+        self.foreground = foreground
+
+
+class _EditorTableModel(QAbstractTableModel):
+    """
+    Table model of the plan editor table. Each row is a list of ``_EditorTableCell``
+    (``None`` for empty cells). The view requests the contents only for the visible cells.
+    ``signal_cell_edited`` is emitted with the row and the column of a cell after the user
+    changes its text or check state. The changes made by calling the methods of the model
+    are not reported by the signal.
+    """
+
+    signal_cell_edited = Signal(int, int)
+
+    _EMPTY_CELL_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, column_labels, parent=None):
+        super().__init__(parent)
+        self._column_labels = tuple(column_labels)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_labels)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._column_labels[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cell = self._rows[index.row()][index.column()]
+        if cell is None:
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return cell.text
+        elif role == Qt.ToolTipRole:
+            return cell.tooltip
+        elif role == Qt.CheckStateRole:
+            return cell.check_state
+        elif role == Qt.ForegroundRole:
+            return cell.foreground
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        cell = self._rows[index.row()][index.column()]
+        return self._EMPTY_CELL_FLAGS if cell is None else cell.flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        cell = self._rows[index.row()][index.column()] if index.isValid() else None
+        if cell is None:
+            return False
+        if role == Qt.EditRole:
+            cell.text = str(value)
+        elif (role == Qt.CheckStateRole) and (cell.check_state is not None):
+            cell.check_state = Qt.Checked if value == Qt.Checked else Qt.Unchecked
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        self.signal_cell_edited.emit(index.row(), index.column())
+        return True
+
+    def cell(self, row, column):
+        """
+        Returns the cell (``_EditorTableCell`` or ``None``).
+        """
+        return self._rows[row][column]
+
+    def set_rows(self, rows):
+        """
+        Replace the table contents with ``rows`` (list of lists of cells). The existing rows
+        are overwritten (the views are notified that the data changed) and the rows are
+        inserted or removed only if the number of rows changes.
+        """
+        rows = [list(_) for _ in rows]
+        n_old, n_new = len(self._rows), len(rows)
+        n_common = min(n_old, n_new)
+
+        if n_common:
+            self._rows[:n_common] = rows[:n_common]
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(n_common - 1, len(self._column_labels) - 1),
+            )
+
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows.extend(rows[n_old:])
+            self.endInsertRows()
+        elif n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._rows[n_new:]
+            self.endRemoveRows()
+
+    def set_cells(self, row, cells):
+        """
+        Replace the cells in the row. ``cells`` is a dictionary: key - column, value - cell.
+        """
+        for column, cell in cells.items():
+            self._rows[row][column] = cell
+        self.dataChanged.emit(self.index(row, min(cells)), self.index(row, max(cells)))
+
+    def set_foreground(self, row, column, foreground):
+        """
+        Set the brush used to display the text of the cell (``None`` - default color).
+        """
+        cell = self._rows[row][column]
+        if (cell is not None) and (cell.foreground is not foreground):
+            cell.foreground = foreground
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index, [Qt.ForegroundRole])
+
+
+class _QtRePlanEditorTable(QTableView):
 
     signal_parameters_valid = Signal(bool)
     signal_item_description_changed = Signal(str)
 
+    # Flags of the cells that display parameter names, metadata and results
+    _NON_EDITABLE_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    # Flags of the check box cells: key - True if the check box is enabled
+    _CHECK_FLAGS = {
+        False: Qt.ItemIsSelectable | Qt.ItemIsUserCheckable,
+        True: Qt.ItemIsSelectable | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled,
+    }
+    # Flags of the value cells: key - (is_editable, is_value_set)
+    _VALUE_FLAGS = {
+        (False, False): Qt.ItemIsSelectable,
+        (False, True): Qt.ItemIsSelectable | Qt.ItemIsEnabled,
+        (True, False): Qt.ItemIsSelectable | Qt.ItemIsEditable,
+        (True, True): Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled,
+    }
+
     def __init__(self, model, parent=None, *, editable=False, detailed=True):
         super().__init__(parent)
         self.model = model
 
         # Colors to display valid and invalid (based on validation) text entries in the table
-        self._text_color_valid = QTableWidgetItem().foreground()
+        #   (None - the default color)
+        self._text_color_valid = None
         self._text_color_invalid = QBrush(QColor(255, 0, 0))
 
-        self._validation_disabled = False
-
         self._queue_item = None  # Copy of the displayed queue item
         self._params = []
         self._params_indices = []
         self._params_descriptions = {}
+        # Results of evaluation of the text in the value cells: key - row,
+        #   value - (text, evaluated value, validity)
+        self._cell_eval_cache = {}
+        self._invalid_rows = set()  # Rows with the values that could not be evaluated
+        # Descriptions and parameters of allowed plans and instructions: key - (type, name)
+        self._item_schema_cache = {}
+        # Parameters of the allowed item used to display '_queue_item' and the flag that
+        #   indicates that the displayed parameters were changed by the user
+        self._displayed_item_schema = None
+        self._item_modified = False
 
         self._item_meta = []
         self._item_result = []
 
         self._table_column_labels = ("Parameter", "", "Value")
-        self.setColumnCount(len(self._table_column_labels))
+        # The cells are created only for the displayed rows, the view formats only visible cells
+        self._table_model = _EditorTableModel(self._table_column_labels, parent=self)
+        self.setModel(self._table_model)
         self.verticalHeader().hide()
 
-        self.setHorizontalHeaderLabels(self._table_column_labels)
-
         self.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
 
         self.setSelectionBehavior(QTableView.SelectRows)
@@ -1369,7 +2239,7 @@ class _QtRePlanEditorTable(QTableWidget):
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setMinimumSectionSize(5)
 
-        self.itemChanged.connect(self.table_item_changed)
+        self._table_model.signal_cell_edited.connect(self.table_item_changed)
 
         self._editable = editable  # Table is editable
         self._detailed = (
@@ -1413,8 +2283,45 @@ class _QtRePlanEditorTable(QTableWidget):
     def _clear_table(self):
         self._params = []
         self._params_indices = []
-        self.clearContents()
-        self.setRowCount(0)
+        self._cell_eval_cache.clear()
+        self._invalid_rows.clear()
+        self._table_model.set_rows([])
+
+    def _get_item_schema(self, item_type, item_name):
+        """
+        Returns parameters of the allowed plan or instruction, formatted parameter descriptions
+        and the list of ``inspect.Parameter`` objects (``None`` if the item is not in the list
+        of allowed plans or instructions). The descriptions and the parameter objects are
+        cached for each item and reused until the model replaces the item parameters
+        (e.g. when the list of allowed plans is reloaded).
+        """
+        if item_type == "plan":
+            item_params = self.model.get_allowed_plan_parameters(name=item_name)
+        else:
+            item_params = self.model.get_allowed_instruction_parameters(name=item_name)
+
+        key = (item_type, item_name)
+        cached = self._item_schema_cache.get(key, None)
+        if cached and (cached[0] is item_params):
+            return cached
+
+        params_descriptions = self.model.extract_descriptions_from_item_parameters(
+            item_parameters=item_params
+        )
+        params_descriptions = self.model.format_item_parameter_descriptions(
+            item_descriptions=params_descriptions
+        )
+        parameters = None
+        if (item_name is not None) and (item_params is not None):
+            # Construct parameters (list of inspect.Parameter objects)
+            parameters, created_type_list = _construct_parameters(
+                item_params.get("parameters", {})
+            )
+
+        schema = (item_params, params_descriptions, parameters)
+        if item_params is not None:
+            self._item_schema_cache[key] = schema
+        return schema
 
     def _item_to_params(self, item):
 
@@ -1425,19 +2332,10 @@ class _QtRePlanEditorTable(QTableWidget):
         item_name = item.get("name", None)
         item_type = item.get("item_type", None)
         if item_type in ("plan", "instruction"):
-            if item_type == "plan":
-                item_params = self.model.get_allowed_plan_parameters(name=item_name)
-            else:
-                item_params = self.model.get_allowed_instruction_parameters(
-                    name=item_name
-                )
-            item_editable = (item_name is not None) and (item_params is not None)
-            params_descriptions = self.model.extract_descriptions_from_item_parameters(
-                item_parameters=item_params
-            )
-            params_descriptions = self.model.format_item_parameter_descriptions(
-                item_descriptions=params_descriptions
+            item_params, params_descriptions, parameters = self._get_item_schema(
+                item_type, item_name
             )
+            item_editable = parameters is not None
         else:
             raise RuntimeError(f"Unknown item type '{item_type}'")
 
@@ -1449,14 +2347,7 @@ class _QtRePlanEditorTable(QTableWidget):
             item_kwargs = dict(**{"ARGS": item_args}, **item_kwargs)
 
         # print(f"plan_params={pprint.pformat(plan_params)}")
-        if item_editable:
-            # Construct parameters (list of inspect.Parameter objects)
-            parameters, created_type_list = _construct_parameters(
-                item_params.get("parameters", {})
-            )
-            # print(f"parameters = {parameters}")
-            # print(f"default = {[_.default for _ in parameters]}")
-        else:
+        if not item_editable:
             parameters = []
             for key, val in item_kwargs.items():
                 p = inspect.Parameter(
@@ -1467,27 +2358,44 @@ class _QtRePlanEditorTable(QTableWidget):
                 )
                 parameters.append(p)
 
+        empty = inspect.Parameter.empty
+        var_kinds = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+        descriptions = params_descriptions.get("parameters", {})
+
         params = []
         for p in parameters:
-            param_value = (
-                item_kwargs[p.name]
-                if (p.name in item_kwargs)
-                else inspect.Parameter.empty
-            )
-            is_value_set = (param_value != inspect.Parameter.empty) or (
-                p.default == inspect.Parameter.empty
-                and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+            param_value = item_kwargs.get(p.name, empty)
+            is_value_set = (param_value is not empty) or (
+                p.default is empty and p.kind not in var_kinds
             )
 
-            # description = item_descriptions.get("parameters", {}).get(p.name, None)
-            # if not description:
-            #     description = f"Description for parameter {p.name} was not found ..."
+            # The values that do not change while the item is edited are formatted once
+            description = descriptions.get(p.name, None)
+            if not description:
+                description = f"Description for parameter '{p.name}' was not found ..."
+
+            display_name = str(p.name)
+            if p.kind == inspect.Parameter.VAR_POSITIONAL:
+                display_name = f"*{display_name}"
+            elif p.kind == inspect.Parameter.VAR_KEYWORD:
+                display_name = f"**{display_name}"
+
+            default_text = "" if p.default == empty else _print_value(p.default)
+            if default_text:
+                default_text += " (default)"
+
             params.append(
                 {
                     "name": p.name,
                     "value": param_value,
                     "is_value_set": is_value_set,
                     "parameters": p,
+                    "display_name": display_name,
+                    "description": description,
+                    "is_optional": (p.default != empty) or (p.kind in var_kinds),
+                    "default_text": default_text,
+                    "value_text": None,  # (value, formatted value)
                 }
             )
 
@@ -1514,15 +2422,24 @@ class _QtRePlanEditorTable(QTableWidget):
         return params, params_descriptions, item_meta, item_result
 
     def _params_to_item(self, params, item):
-        item = copy.deepcopy(item)
+        # 'args' and 'kwargs' are replaced, the other values are not modified
+        item = item.copy()
+
+        empty = inspect.Parameter.empty
+        var_positional = inspect.Parameter.VAR_POSITIONAL
+        var_keyword = inspect.Parameter.VAR_KEYWORD
+
+        # Flags indicating if the parameter value is set and the kinds of the parameters
+        is_set = [p["is_value_set"] and (p["value"] is not empty) for p in params]
+        kinds = [p["parameters"].kind for p in params]
 
         # Find if there are VAR_POSITIONAL or VAR_KEYWORD arguments with set values
         n_var_pos, n_var_kwd = -1, -1
-        for n, p in enumerate(params):
-            if p["is_value_set"] and (p["value"] != inspect.Parameter.empty):
-                if p["parameters"].kind == inspect.Parameter.VAR_POSITIONAL:
+        for n, kind in enumerate(kinds):
+            if is_set[n]:
+                if kind == var_positional:
                     n_var_pos = n
-                elif p["parameters"].kind == inspect.Parameter.VAR_KEYWORD:
+                elif kind == var_keyword:
                     n_var_kwd = n
 
         # Collect 'args'
@@ -1533,9 +2450,7 @@ class _QtRePlanEditorTable(QTableWidget):
                     f"Invalid type of VAR_POSITIONAL argument: {params[n_var_pos]['value']}"
                 )
             for n in range(n_var_pos):
-                if params[n]["is_value_set"] and (
-                    params[n]["value"] != inspect.Parameter.empty
-                ):
+                if is_set[n]:
                     args.append(params[n]["value"])
             args.extend(params[n_var_pos]["value"])
 
@@ -1545,9 +2460,7 @@ class _QtRePlanEditorTable(QTableWidget):
 
         kwargs = {}
         for n in range(n_start, n_stop):
-            if params[n]["is_value_set"] and (
-                params[n]["value"] != inspect.Parameter.empty
-            ):
+            if is_set[n]:
                 kwargs[params[n]["parameters"].name] = params[n]["value"]
 
         if n_var_kwd > 0:
@@ -1562,170 +2475,149 @@ class _QtRePlanEditorTable(QTableWidget):
 
         return item
 
-    def _show_row_value(self, *, row):
-        def print_value(v):
-            if isinstance(v, str):
-                return f"'{v}'"
-            else:
-                return str(v)
-
-        p = self._params[row]
-        p_name = p["name"]
-        value = p["value"]
-        default_value = p["parameters"].default
-        is_var_positional = p["parameters"].kind == inspect.Parameter.VAR_POSITIONAL
-        is_var_keyword = p["parameters"].kind == inspect.Parameter.VAR_KEYWORD
+    def _get_value_text_and_flags(self, p):
+        """
+        Returns the text and the flags of the cell that displays the value of the parameter ``p``.
+        """
         is_value_set = p["is_value_set"]
-        is_optional = (
-            (default_value != inspect.Parameter.empty)
-            or is_var_positional
-            or is_var_keyword
-        )
-        is_editable = self._editable and (is_value_set or not is_optional)
-
-        description = self._params_descriptions.get("parameters", {}).get(p_name, None)
-        if not description:
-            description = f"Description for parameter '{p_name}' was not found ..."
-
-        v = value if is_value_set else default_value
-        s_value = "" if v == inspect.Parameter.empty else print_value(v)
-        if not is_value_set and s_value:
-            s_value += " (default)"
-
-        # Set checkable item in column 1
-        check_item = QTableWidgetItem()
-        check_item.setFlags(check_item.flags() | Qt.ItemIsUserCheckable)
-        if not is_optional:
-            # Checked and disabled
-            check_item.setFlags(check_item.flags() & ~Qt.ItemIsEnabled)
-            check_item.setCheckState(Qt.Checked)
-        else:
-            if self._editable:
-                check_item.setFlags(check_item.flags() | Qt.ItemIsEnabled)
-            else:
-                check_item.setFlags(check_item.flags() & ~Qt.ItemIsEnabled)
+        is_editable = self._editable and (is_value_set or not p["is_optional"])
 
-            if is_value_set:
-                check_item.setCheckState(Qt.Checked)
+        if is_value_set:
+            # The text is reused while the parameter holds the same value object
+            value = p["value"]
+            cached = p["value_text"]
+            if cached and (cached[0] is value):
+                s_value = cached[1]
             else:
-                check_item.setCheckState(Qt.Unchecked)
-
-        self.setItem(row, 1, check_item)
+                s_value = (
+                    "" if value == inspect.Parameter.empty else _print_value(value)
+                )
+                p["value_text"] = (value, s_value)
+        else:
+            s_value = p["default_text"]
 
-        # Set value in column 2
-        value_item = QTableWidgetItem(s_value)
+        return s_value, self._VALUE_FLAGS[(is_editable, is_value_set)]
 
-        if is_editable:
-            value_item.setFlags(value_item.flags() | Qt.ItemIsEditable)
-        else:
-            value_item.setFlags(value_item.flags() & ~Qt.ItemIsEditable)
+    def _create_value_cells(self, p):
+        """
+        Returns the cells that display the check box (column 1) and the value (column 2)
+        of the parameter ``p``.
+        """
+        is_optional = p["is_optional"]
 
-        if is_value_set:
-            value_item.setFlags(value_item.flags() | Qt.ItemIsEnabled)
-        else:
-            value_item.setFlags(value_item.flags() & ~Qt.ItemIsEnabled)
+        # Checkable cell in column 1. Required parameters are checked and disabled.
+        is_checked = p["is_value_set"] or not is_optional
+        check_cell = _EditorTableCell(
+            flags=self._CHECK_FLAGS[is_optional and self._editable],
+            check_state=Qt.Checked if is_checked else Qt.Unchecked,
+        )
 
-        value_item.setToolTip(description)
+        # Value in column 2
+        s_value, value_flags = self._get_value_text_and_flags(p)
+        value_cell = _EditorTableCell(
+            s_value, tooltip=p["description"], flags=value_flags
+        )
 
-        self.setItem(row, 2, value_item)
+        return check_cell, value_cell
 
-    def _fill_table(self):
-        def print_value(v):
-            if isinstance(v, str):
-                return f"'{v}'"
-            else:
-                return str(v)
+    def _update_value_cell(self, row, p):
+        """
+        Updates the existing value cell in ``row`` after the parameter ``p`` was enabled or
+        disabled using the check box. The check box cell is already updated by the user.
+        """
+        value_cell = self._table_model.cell(row, 2)
+        value_cell.text, value_cell.flags = self._get_value_text_and_flags(p)
+        value_cell.foreground = self._text_color_valid
+        self._table_model.set_cells(row, {2: value_cell})
 
-        self._validation_disabled = True
-        self.clearContents()
+    def _create_read_only_row(self, key, value):
+        """
+        Returns the cells of the row that displays metadata or results of the item.
+        """
+        flags = self._NON_EDITABLE_FLAGS
+        return [
+            _EditorTableCell(str(key), flags=flags),
+            None,
+            _EditorTableCell(str(value), flags=flags),
+        ]
 
+    def _fill_table(self):
         params = self._params
-        params_descriptions = self._params_descriptions
         item_meta = self._item_meta
         item_result = self._item_result
 
-        # By default select all indexes of 'params'
-        self._params_indices = list(range(len(params)))
-        params_indices = self._params_indices
-
-        # Remove parameters with default values (only when editing is disabled)
+        # By default select all indexes of 'params'. Remove parameters with default values
+        #   (only when editing is disabled). The values may change during editing, so
+        #   the indices are computed each time the table is filled.
         if (not self._editable) and (not self._detailed):
-            params_indices.clear()
-            for n, p in enumerate(params):
-                if p["value"] != inspect.Parameter.empty:
-                    params_indices.append(n)
+            empty = inspect.Parameter.empty
+            params_indices = [
+                n for n, p in enumerate(params) if p["value"] is not empty
+            ]
+        else:
+            params_indices = list(range(len(params)))
+        self._params_indices = params_indices
 
-        self.setRowCount(len(params_indices) + len(item_meta) + len(item_result))
+        # Rows may now display different parameters
+        self._cell_eval_cache.clear()
 
-        for n, p_index in enumerate(params_indices):
+        # The cells of all rows are created first and then passed to the table model at once
+        rows = []
+        for p_index in params_indices:
             p = params[p_index]
+            key_cell = _EditorTableCell(
+                p["display_name"],
+                tooltip=p["description"],
+                flags=self._NON_EDITABLE_FLAGS,
+            )
+            rows.append([key_cell, *self._create_value_cells(p)])
 
-            is_var_positional = p["parameters"].kind == inspect.Parameter.VAR_POSITIONAL
-            is_var_keyword = p["parameters"].kind == inspect.Parameter.VAR_KEYWORD
+        # Display metadata and results (if exist)
+        rows.extend(
+            self._create_read_only_row(k, v)
+            for k, v in itertools.chain(item_meta, item_result)
+        )
 
-            key = p["parameters"].name
-            value = p["value"]
-            default_value = p["parameters"].default
+        # The table is repainted once after the model is updated and the text colors are updated
+        #   based on the results of validation.
+        self.setUpdatesEnabled(False)
+        try:
+            self._table_model.set_rows(rows)
+            self._validate_cell_values()
+        finally:
+            self.setUpdatesEnabled(True)
 
-            description = params_descriptions.get("parameters", {}).get(key, None)
-            if not description:
-                description = (
-                    f"Description for parameter '{self._queue_item.get('name', '-')}' "
-                    f"was not found ..."
-                )
+    def show_item(self, *, item, editable=None):
+        editable = self._editable if editable is None else bool(editable)
 
-            is_value_set = p["is_value_set"]
-
-            v = value if is_value_set else default_value
-            s_value = "" if v == inspect.Parameter.empty else print_value(v)
-            if not is_value_set:
-                s_value += " (default)"
-
-            key_name = str(key)
-            if is_var_positional:
-                key_name = f"*{key_name}"
-            elif is_var_keyword:
-                key_name = f"**{key_name}"
-            key_item = QTableWidgetItem(key_name)
-            key_item.setToolTip(description)
-            key_item.setFlags(key_item.flags() & ~Qt.ItemIsEditable)
-            self.setItem(n, 0, key_item)
-
-            self._show_row_value(row=n)
-
-        # Display metadata (if exists)
-        n_row = len(params_indices)  # Number of table row
-        for k, v in item_meta:
-            key_item = QTableWidgetItem(str(k))
-            key_item.setFlags(key_item.flags() & ~Qt.ItemIsEditable)
-            self.setItem(n_row, 0, key_item)
-            value_item = QTableWidgetItem(str(v))
-            value_item.setFlags(key_item.flags() & ~Qt.ItemIsEditable)
-            self.setItem(n_row, 2, value_item)
-            n_row += 1
-
-        # Display results (if exist)
-        for k, v in item_result:
-            key_item = QTableWidgetItem(str(k))
-            key_item.setFlags(key_item.flags() & ~Qt.ItemIsEditable)
-            self.setItem(n_row, 0, key_item)
-            value_item = QTableWidgetItem(str(v))
-            value_item.setFlags(key_item.flags() & ~Qt.ItemIsEditable)
-            self.setItem(n_row, 2, value_item)
-            n_row += 1
-
-        self._validation_disabled = False
-        self._validate_cell_values()
+        item_type = item.get("item_type", None) if item else None
+        if item_type in ("plan", "instruction"):
+            item_schema = self._get_item_schema(item_type, item.get("name", None))
+        else:
+            item_schema = None
 
-    def show_item(self, *, item, editable=None):
-        if editable is not None:
-            self._editable = bool(editable)
+        # The table is not refilled if the same item is displayed in the same mode,
+        #   the item was not edited and the parameters of the allowed item did not change.
+        if (
+            (item == self._queue_item)
+            and (editable == self._editable)
+            and not self._item_modified
+            and ((item is None) or (item_schema is not None))
+            and (item_schema is self._displayed_item_schema)
+        ):
+            return
 
-        # Keep the copy of the queue item
-        self._queue_item = copy.deepcopy(item)
+        self._editable = editable
+        self._displayed_item_schema = item_schema
+
+        # Keep the copy of the queue item. Shallow copy is sufficient: the nested values
+        #   are never modified ('_params_to_item' creates new 'args' and 'kwargs').
+        self._queue_item = dict(item) if item is not None else None
         self.reset_item()
 
     def reset_item(self):
+        self._item_modified = False
+
         # Generate parameters
         (
             self._params,
@@ -1747,6 +2639,50 @@ class _QtRePlanEditorTable(QTableWidget):
         # Send the signal that updates item description somewhere else in the code
         self.signal_item_description_changed.emit(description)
 
+    def _validate_row(self, n):
+        """
+        Validates the cell in row ``n`` that is expected to have manually entered parameter.
+        The cell is skipped if it displays the default value. The successfully evaluated value is
+        saved to the parameter list.
+
+        Returns
+        -------
+        boolean
+            False if the text in the cell could not be evaluated, True otherwise.
+        """
+        p = self._params[self._params_indices[n]]
+        if not p["is_value_set"]:
+            return True
+
+        cell = self._table_model.cell(n, 2)
+        if not cell:
+            return True
+
+        # The text is evaluated only if it changed since the last validation
+        cached = self._cell_eval_cache.get(n, None)
+        if cached and (cached[0] == cell.text):
+            _, value, cell_valid = cached
+        else:
+            value, cell_valid = None, True
+            try:
+                # Currently the simples verification is performed:
+                #   - The cell is evaluated.
+                #   - If the evaluation is successful, then the value is saved.
+                # TODO: verify type of the loaded value whenever possible
+                value = ast.literal_eval(cell.text)
+            except Exception:
+                cell_valid = False
+            self._cell_eval_cache[n] = (cell.text, value, cell_valid)
+
+        if cell_valid:
+            p["value"] = value
+
+        # The view is notified only if the color of the text changes
+        self._table_model.set_foreground(
+            n, 2, self._text_color_valid if cell_valid else self._text_color_invalid
+        )
+        return cell_valid
+
     def _validate_cell_values(self):
         """
         Validates each cell in the table that is expected to have manually entered parameters.
@@ -1757,65 +2693,54 @@ class _QtRePlanEditorTable(QTableWidget):
         Signal is emitted to report results of parameter validation (may be used to
         enable/disable buttons in other widges, e.g. 'Ok' button).
         """
-        # Validation may be disabled while the table is being filled.
-        if self._validation_disabled:
-            return
+        self._invalid_rows = {
+            n for n in range(len(self._params_indices)) if not self._validate_row(n)
+        }
+        self.signal_parameters_valid.emit(not self._invalid_rows)
+
+    def _validate_changed_row(self, n):
+        """
+        Validates the cell in row ``n`` after it was changed by the user. The signal reporting
+        results of parameter validation is emitted only if validity of the table changes.
+        """
+        was_valid = not self._invalid_rows
+        if self._validate_row(n):
+            self._invalid_rows.discard(n)
+        else:
+            self._invalid_rows.add(n)
+        is_valid = not self._invalid_rows
+        if is_valid != was_valid:
+            self.signal_parameters_valid.emit(is_valid)
 
-        data_valid = True
-        for n, p_index in enumerate(self._params_indices):
-            p = self._params[p_index]
-            if p["is_value_set"]:
-                table_item = self.item(n, 2)
-
-                if table_item:
-                    cell_valid = True
-                    cell_text = table_item.text()
-                    try:
-                        # Currently the simples verification is performed:
-                        #   - The cell is evaluated.
-                        #   - If the evaluation is successful, then the value is saved.
-                        # TODO: verify type of the loaded value whenever possible
-                        p["value"] = ast.literal_eval(cell_text)
-                    except Exception:
-                        cell_valid = False
-                        data_valid = False
-
-                    table_item.setForeground(
-                        self._text_color_valid
-                        if cell_valid
-                        else self._text_color_invalid
-                    )
-
-        self.signal_parameters_valid.emit(data_valid)
-
-    def table_item_changed(self, table_item):
+    @Slot(int, int)
+    def table_item_changed(self, row, column):
+        """
+        The handler for ``signal_cell_edited`` of the table model: the user changed the text
+        or the check state of the cell.
+        """
+        self._item_modified = True
         try:
-            row = self.row(table_item)
-            column = self.column(table_item)
+            p = self._params[self._params_indices[row]]
             if column == 1:
-                is_checked = table_item.checkState() == Qt.Checked
-                if self._params[row]["is_value_set"] != is_checked:
+                is_checked = self._table_model.cell(row, 1).check_state == Qt.Checked
+                if p["is_value_set"] != is_checked:
 
-                    if (
-                        is_checked
-                        and self._params[row]["value"] == inspect.Parameter.empty
-                    ):
-                        self._params[row]["value"] = self._params[row][
-                            "parameters"
-                        ].default
+                    if is_checked and p["value"] == inspect.Parameter.empty:
+                        p["value"] = p["parameters"].default
 
-                    self._params[row]["is_value_set"] = is_checked
-                    self._show_row_value(row=row)
+                    p["is_value_set"] = is_checked
+                    self._cell_eval_cache.pop(row, None)
+                    self._update_value_cell(row, p)
+                    self._validate_changed_row(row)
 
             elif column == 2:
-                self._validate_cell_values()
+                self._validate_changed_row(row)
         except ValueError:
             pass
 
 
 class _QtReViewer(QWidget):
 
-    signal_update_widgets = Signal()
     signal_update_selection = Signal(int)
     signal_edit_queue_item = Signal(object)
 
@@ -1826,6 +2751,8 @@ class _QtReViewer(QWidget):
         self._queue_item_name = ""
         self._queue_item_type = None
 
+        self._last_enable_state = None
+
         self._lb_item_type = QLabel("Plan:")
         self._lb_item_name_default = "-"
         self._lb_item_name = QLabel(self._lb_item_name_default)
@@ -1874,8 +2801,7 @@ class _QtReViewer(QWidget):
         )
         self.signal_update_selection.connect(self.slot_change_selection)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widgets.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
         self._wd_editor.signal_item_description_changed.connect(
             self.slot_item_description_changed
@@ -1886,8 +2812,9 @@ class _QtReViewer(QWidget):
         sel_item_pos = self.model.queue_item_uid_to_pos(sel_item_uid)
         self.signal_update_selection.emit(sel_item_pos)
 
-    def on_update_widgets(self, event):
-        self.signal_update_widgets.emit()
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets()
 
     @Slot()
     def slot_update_widgets(self):
@@ -1911,6 +2838,11 @@ class _QtReViewer(QWidget):
 
         is_connected = bool(self.model.re_manager_connected)
 
+        state = (is_item_allowed, is_connected)
+        if state == self._last_enable_state:
+            return
+        self._last_enable_state = state
+
         self._pb_copy_to_queue.setEnabled(is_item_allowed and is_connected)
         self._pb_edit.setEnabled(is_item_allowed)
 
@@ -1921,7 +2853,8 @@ class _QtReViewer(QWidget):
     @Slot(int)
     def slot_change_selection(self, sel_item_pos):
         if sel_item_pos >= 0:
-            item = copy.deepcopy(self.model._plan_queue_items[sel_item_pos])
+            # The item is not modified here, the editor keeps its own copy (see 'show_item')
+            item = self.model._plan_queue_items[sel_item_pos]
         else:
             item = None
 
@@ -1941,10 +2874,12 @@ class _QtReViewer(QWidget):
         self._update_widget_state()
         self._wd_editor.show_item(item=item)
 
+    @Slot(int)
     def _cb_show_optional_state_changed(self, state):
         is_checked = state == Qt.Checked
         self._wd_editor.detailed = is_checked
 
+    @Slot()
     def _pb_copy_to_queue_clicked(self):
         """
         Copy currently selected item to queue.
@@ -1954,6 +2889,7 @@ class _QtReViewer(QWidget):
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_edit_clicked(self):
         sel_item_uid = self.model.selected_queue_item_uid
         sel_item = self.model.queue_item_by_uid(sel_item_uid)  # Returns deep copy
@@ -1962,7 +2898,6 @@ class _QtReViewer(QWidget):
 
 class _QtReEditor(QWidget):
 
-    signal_update_widgets = Signal()
     signal_switch_tab = Signal(str)
     signal_allowed_plan_changed = Signal()
 
@@ -1981,6 +2916,8 @@ class _QtReEditor(QWidget):
         self._queue_item_loaded = False
         self._editor_state_valid = False
 
+        self._last_enable_state = None
+
         self._rb_item_plan = QRadioButton("Plan")
         self._rb_item_plan.setChecked(True)
         self._rb_item_instruction = QRadioButton("Instruction")
@@ -1989,12 +2926,23 @@ class _QtReEditor(QWidget):
         self._grp_item_type.addButton(self._rb_item_instruction)
 
         self._combo_item_list = QComboBox()
+        self._combo_item_names = []  # The list of names displayed in the combo box
+        # The list of names is replaced at once instead of inserting the names one by one
+        self._combo_item_model = QStringListModel(self)
+        self._combo_item_list.setModel(self._combo_item_model)
         self._combo_item_list.setSizeAdjustPolicy(QComboBox.AdjustToContents)
         # self._combo_item_list.setSizePolicy(QComboBox.AdjustToContents)
         self._combo_item_list.currentIndexChanged.connect(
             self._combo_item_list_sel_changed
         )
 
+        # Preview is displayed after the selection in the combo box stops changing
+        #   (e.g. while the user scrolls through the list using arrow keys)
+        self._preview_update_delay = 80  # ms
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._flush_item_preview)
+
         self._pb_new_item = QPushButton("New")
         self._lb_item_source = QLabel(self._current_item_source)
 
@@ -2045,18 +2993,20 @@ class _QtReEditor(QWidget):
         self.model.events.allowed_plans_changed.connect(self._on_allowed_plans_changed)
         self.signal_allowed_plan_changed.connect(self._slot_allowed_plans_changed)
 
-        self.model.events.status_changed.connect(self.on_update_widgets)
-        self.signal_update_widgets.connect(self.slot_update_widgets)
+        _connect_status_changed(self.model, self.on_update_widgets)
 
         self._set_allowed_item_list()
 
         self._update_widget_state()
 
-    def _set_allowed_item_list(self):
+    def _set_allowed_item_list(self, *, force_update=False):
         # self._queue_item_type must be "plan" or "instruction"
         # self._current_plan_name and self._current_item_name should be properly set.
         #   The first item in the list is selected if the value is set to "".
         #   No element selected if the element with the given name is not in the list.
+        # The combo box is repopulated only if the list of names changed. The selection
+        #   is processed once if the list or the selected index changed or if 'force_update'
+        #   is True (e.g. parameters of the allowed plans could change).
 
         if self._current_item_type == "plan":
             allowed_item_names = self.model.get_allowed_plan_names()
@@ -2070,20 +3020,42 @@ class _QtReEditor(QWidget):
                 self._current_instruction_name = allowed_item_names[0]
             item_name = self._current_instruction_name
 
-        self._combo_item_list.clear()
-        self._combo_item_list.addItems(allowed_item_names)
-
         try:
             index = allowed_item_names.index(item_name)
         except ValueError:
             index = -1
 
-        self._combo_item_list.setCurrentIndex(index)
+        list_changed = allowed_item_names != self._combo_item_names
+        index_changed = index != self._combo_item_list.currentIndex()
+
+        # Replacing the list of names changes the current index several times.
+        #   The signals are blocked and the change of selection is processed once.
+        self._combo_item_list.blockSignals(True)
+        try:
+            if list_changed:
+                self._combo_item_model.setStringList(allowed_item_names)
+                self._combo_item_names = list(allowed_item_names)
+            self._combo_item_list.setCurrentIndex(index)
+        finally:
+            self._combo_item_list.blockSignals(False)
+
+        if list_changed or index_changed or force_update:
+            self._combo_item_list_sel_changed(index)
 
     def _update_widget_state(self):
 
         is_connected = bool(self.model.re_manager_connected)
 
+        state = (
+            is_connected,
+            self._queue_item_loaded,
+            self._editor_state_valid,
+            self._current_item_source,
+        )
+        if state == self._last_enable_state:
+            return
+        self._last_enable_state = state
+
         self._rb_item_plan.setEnabled(not self._queue_item_loaded)
         self._rb_item_instruction.setEnabled(not self._queue_item_loaded)
         self._combo_item_list.setEnabled(not self._queue_item_loaded)
@@ -2124,6 +3096,7 @@ class _QtReEditor(QWidget):
 
             self._set_allowed_item_list()
 
+            self._preview_timer.stop()
             self._wd_editor.show_item(item=queue_item, editable=True)
 
             self._queue_item_loaded = True
@@ -2131,8 +3104,9 @@ class _QtReEditor(QWidget):
 
     def _show_item_preview(self):
         """
-        Generate and display preview (not editable)
+        Generate and display preview (not editable). Pending delayed update is cancelled.
         """
+        self._preview_timer.stop()
         item_name = self._combo_item_list.currentText()
         item_type = self._current_item_type
         if item_name:
@@ -2148,8 +3122,9 @@ class _QtReEditor(QWidget):
             elif item_type == "instruction":
                 self._current_instruction_name = item_name
 
-    def on_update_widgets(self, event):
-        self.signal_update_widgets.emit()
+    @Slot(object)
+    def on_update_widgets(self, snapshot):
+        self.slot_update_widgets()
 
     @Slot()
     def slot_update_widgets(self):
@@ -2164,6 +3139,7 @@ class _QtReEditor(QWidget):
         self._editor_state_valid = is_valid
         self._update_widget_state()
 
+    @Slot()
     def _pb_new_item_clicked(self):
         item_type = self._current_item_type
         item_name = self._combo_item_list.currentText()
@@ -2172,6 +3148,7 @@ class _QtReEditor(QWidget):
             self._current_item_source = "NEW ITEM"
             self._edit_item(new_item)
 
+    @Slot()
     def _pb_add_to_queue_clicked(self):
         """
         Add item to queue
@@ -2189,6 +3166,7 @@ class _QtReEditor(QWidget):
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_save_item_clicked(self):
         """
         Save item to queue (update the edited item)
@@ -2205,12 +3183,14 @@ class _QtReEditor(QWidget):
         except Exception as ex:
             print(f"Exception: {ex}")
 
+    @Slot()
     def _pb_reset_clicked(self):
         """
         Restore parameters to the original values
         """
         self._wd_editor.reset_item()
 
+    @Slot()
     def _pb_cancel_clicked(self):
         self._wd_editor.show_item(item=None)
         self._queue_item_loaded = False
@@ -2220,6 +3200,7 @@ class _QtReEditor(QWidget):
         self._update_widget_state()
         self._show_item_preview()
 
+    @Slot(QAbstractButton, bool)
     def _grp_item_type_button_toggled(self, button, checked):
         if checked:
             if button == self._rb_item_plan:
@@ -2229,10 +3210,16 @@ class _QtReEditor(QWidget):
                 self._current_item_type = "instruction"
                 self._set_allowed_item_list()
 
+    @Slot(int)
     def _combo_item_list_sel_changed(self, index):
         self._save_selected_item_name()
         # We don't process the case when the list of allowed plans changes and the selected
         #   item is not in the list. But this is not a practical case.
+        if not self._queue_item_loaded:
+            self._preview_timer.start(self._preview_update_delay)
+
+    @Slot()
+    def _flush_item_preview(self):
         if not self._queue_item_loaded:
             self._show_item_preview()
 
@@ -2241,7 +3228,7 @@ class _QtReEditor(QWidget):
 
     @Slot()
     def _slot_allowed_plans_changed(self):
-        self._set_allowed_item_list()
+        self._set_allowed_item_list(force_update=True)
 
 
 class QtRePlanEditor(QWidget):